@@ -1,12 +1,12 @@
 import logging
+import logging.handlers
 import sys
-import platform
 from ui.main_window import MainWindow
-from src.app_utils import initialize_data_files, restore_default_files
+from src.app_utils import get_data_path, initialize_data_files, restore_default_files
 
 def handle_console_visibility():
     """Hide console window on Windows unless --debug flag is provided."""
-    if platform.system() == 'Windows' and '--debug' not in sys.argv:
+    if sys.platform == 'win32' and '--debug' not in sys.argv:
         try:
             import ctypes
             # Get handle to console window
@@ -21,9 +21,6 @@ def handle_console_visibility():
 def setup_logging():
     """Configure application-wide logging."""
     # Create logs directory if it doesn't exist
-    from pathlib import Path
-    from src.app_utils import get_data_path
-
     log_dir = get_data_path()
 
     # Ensure the directory exists
@@ -31,14 +28,16 @@ def setup_logging():
 
     log_file = log_dir / 'fish_renamer.log'
 
-    # Configure logging
+    # Configure logging; the log file is only opened on the first record
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=1_000_000, backupCount=3, delay=True),
             logging.StreamHandler(sys.stdout)
-        ]
+        ],
+        force=True
     )
 
     logger = logging.getLogger(__name__)
@@ -77,7 +76,7 @@ if __name__ == '__main__':
     try:
         app = MainWindow()
     except Exception as e:
-        logger.error(f"Startup failed: {e}", exc_info=True)
+        logger.error("Startup failed: %s", e, exc_info=True)
         logger.info("Restoring default configuration files...")
         restore_default_files()
         show_reset_warning()
@@ -43,7 +43,7 @@ def validate_safe_path(base_dir: Path, file_path: Path) -> bool:
             # Path is not relative to base_dir
             return False
     except (ValueError, OSError, RuntimeError) as e:
-        logger.warning(f"Path validation failed for {file_path}: {e}")
+        logger.warning("Path validation failed for %s: %s", file_path, e)
         return False
 
 def get_app_path() -> Path:
@@ -69,53 +69,62 @@ def initialize_data_files():
     # Create data directory if it doesn't exist
     if not data_dir.exists():
         data_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created data directory at {data_dir}")
+        logger.info("Created data directory at %s", data_dir)
 
     # Check if data files already exist (look for CSV/JSON files, not just any files like logs)
-    data_extensions = {'.csv', '.json'}
-    existing_data_files = [f for f in data_dir.iterdir() if f.suffix.lower() in data_extensions]
+    # Stops at the first data file found, so warm starts cost a partial listing at most
+    data_extensions = ('.csv', '.json')
+    with os.scandir(data_dir) as entries:
+        has_data_files = any(entry.name.lower().endswith(data_extensions) for entry in entries)
 
-    if existing_data_files:
-        logger.info(f"Data directory already has {len(existing_data_files)} data files. Skipping initialization.")
+    if has_data_files:
+        logger.info("Data directory already has data files. Skipping initialization.")
         return
 
     config_source_dir = get_app_path().parent / 'config'
     if not config_source_dir.exists():
-        logger.warning(f"Config source directory not found at {config_source_dir}")
+        logger.warning("Config source directory not found at %s", config_source_dir)
         return
 
-    for file_name in os.listdir(config_source_dir):
-        # Validate path to prevent path traversal attacks
-        if not validate_safe_path(config_source_dir, Path(file_name)):
-            logger.warning(f"Skipping potentially unsafe path: {file_name}")
-            continue
+    # List the destination once instead of stat'ing each target
+    existing = set(os.listdir(data_dir))
 
-        source_path = config_source_dir / file_name
-        dest_path = data_dir / file_name
+    # scandir entries carry their file type, so no extra stat per source file
+    with os.scandir(config_source_dir) as entries:
+        for entry in entries:
+            file_name = entry.name
+            # Validate path to prevent path traversal attacks
+            if not validate_safe_path(config_source_dir, Path(file_name)):
+                logger.warning("Skipping potentially unsafe path: %s", file_name)
+                continue
+
+            dest_path = data_dir / file_name
 
-        # Also validate destination path
-        if not validate_safe_path(data_dir, Path(file_name)):
-            logger.warning(f"Skipping unsafe destination path: {file_name}")
-            continue
+            # Also validate destination path
+            if not validate_safe_path(data_dir, Path(file_name)):
+                logger.warning("Skipping unsafe destination path: %s", file_name)
+                continue
 
-        if not dest_path.exists():
-            logger.info(f"Initializing data file: {file_name}")
-            shutil.copy(source_path, dest_path)
+            if entry.is_file() and file_name not in existing:
+                logger.info("Initializing data file: %s", file_name)
+                # Contents only; the bundled permission bits are not needed
+                shutil.copyfile(entry.path, dest_path)
 
 def clear_data_files():
     """Deletes all data/config files in the data directory, skipping log files."""
     data_dir = get_data_path()
     if data_dir.exists() and data_dir.is_dir():
         for item in data_dir.iterdir():
-            if item.suffix == '.log':
+            # Also keeps rotated backups such as fish_renamer.log.1
+            if item.suffix == '.log' or item.stem.endswith('.log'):
                 continue
             try:
                 os.remove(item)
             except PermissionError:
-                logger.warning(f"Could not remove {item} (file in use)")
-        logger.info(f"Cleared data files in {data_dir}")
+                logger.warning("Could not remove %s (file in use)", item)
+        logger.info("Cleared data files in %s", data_dir)
     else:
-        logger.warning(f"Data directory {data_dir} does not exist or is not a directory.")
+        logger.warning("Data directory %s does not exist or is not a directory.", data_dir)
 
 def restore_default_files():
     """Force-copies all bundled default files to the data directory, overwriting existing ones.
@@ -134,17 +143,71 @@ def restore_default_files():
     # Copy all bundled config files, overwriting any corrupted ones
     config_source_dir = get_app_path().parent / 'config'
     if not config_source_dir.exists():
-        logger.warning(f"Config source directory not found at {config_source_dir}")
+        logger.warning("Config source directory not found at %s", config_source_dir)
         return
 
-    for file_name in os.listdir(config_source_dir):
-        if not validate_safe_path(config_source_dir, Path(file_name)):
-            continue
-        source_path = config_source_dir / file_name
-        dest_path = data_dir / file_name
-        if source_path.is_file():
-            logger.info(f"Restoring default file: {file_name}")
-            shutil.copy(source_path, dest_path)
+    with os.scandir(config_source_dir) as entries:
+        for entry in entries:
+            file_name = entry.name
+            if not validate_safe_path(config_source_dir, Path(file_name)):
+                continue
+            if entry.is_file():
+                logger.info("Restoring default file: %s", file_name)
+                shutil.copyfile(entry.path, data_dir / file_name)
+
+def _name_key(name: str) -> str:
+    """Normalize a filename for collision checks.
+
+    Windows and macOS filesystems are case-insensitive by default, so names
+    differing only in case collide there.
+    """
+    return name.casefold() if sys.platform in ('win32', 'darwin') else name
+
+def snapshot_directory_names(paths) -> dict[str, set[str]]:
+    """List each directory touched by a batch of file paths once.
+
+    Args:
+        paths: Iterable of file paths
+
+    Returns:
+        Dict mapping directory path to the set of entry names it contains.
+        Directories that cannot be listed are left out.
+    """
+    snapshot = {}
+    for dir_name in {os.path.dirname(p) for p in paths}:
+        try:
+            with os.scandir(dir_name or '.') as it:
+                snapshot[dir_name] = {_name_key(entry.name) for entry in it}
+        except OSError as e:
+            logger.debug("Could not list %s: %s", dir_name, e)
+    return snapshot
+
+def path_taken(snapshot: dict[str, set[str]] | None, path: str) -> bool:
+    """Check whether path already exists, using a directory snapshot when available.
+
+    Args:
+        snapshot: Result of snapshot_directory_names(), or None
+        path: Target file path
+
+    Returns:
+        bool: True if an entry with that name exists
+    """
+    dir_name, name = os.path.split(path)
+    names = snapshot.get(dir_name) if snapshot is not None else None
+    if names is None:
+        return os.path.exists(path)
+    return _name_key(name) in names
+
+def record_rename(snapshot: dict[str, set[str]] | None, old_path: str, new_path: str):
+    """Keep a directory snapshot in sync after a successful rename."""
+    if snapshot is None:
+        return
+    old_names = snapshot.get(os.path.dirname(old_path))
+    if old_names is not None:
+        old_names.discard(_name_key(os.path.basename(old_path)))
+    new_names = snapshot.get(os.path.dirname(new_path))
+    if new_names is not None:
+        new_names.add(_name_key(os.path.basename(new_path)))
 
 def get_filename_diff(original: str, new: str) -> tuple[str, str, str]:
     """Calculate common prefix, changed part, and common suffix between two filenames.
@@ -1,6 +1,7 @@
 # config_manager.py
 import configparser
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Union
 from src import app_utils
@@ -18,6 +19,14 @@ from src.constants import (
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_PATHS: Dict[str, str] = {
+    'species': DEFAULT_SPECIES_FILE,
+    'photographers': DEFAULT_PHOTOGRAPHERS_FILE,
+    'divesites': DEFAULT_DIVESITES_FILE,
+    'activities': DEFAULT_ACTIVITIES_FILE,
+    'labels': DEFAULT_LABELS_FILE
+}
+
 class ConfigManager:
     """Manages reading and writing application settings to config.ini."""
 
@@ -28,6 +37,8 @@ class ConfigManager:
         self.user_prefs: Dict[str, str] = {}
         self.paths: Dict[str, str] = {}
         self.misc: Dict[str, str] = {}
+        self._path_cache: Dict[str, Path] = {}
+        self._dirty: bool = False  # True when in-memory settings differ from the file
         self.load()
 
     def load(self) -> None:
@@ -41,8 +52,10 @@ class ConfigManager:
             self.user_prefs = dict(self.config.items(CONFIG_SECTION_USER_PREFS))
             self.paths = dict(self.config.items(CONFIG_SECTION_PATHS))
             self.misc = dict(self.config.items(CONFIG_SECTION_MISC))
+            self._path_cache.clear()
+            self._dirty = False
         except (configparser.Error, KeyError, ValueError) as e:
-            logger.error(f"Failed to parse config file: {e}")
+            logger.error("Failed to parse config file: %s", e)
             self._set_defaults()
             return
 
@@ -52,16 +65,26 @@ class ConfigManager:
 
 
     def save(self) -> None:
-        """Saves the current configuration to the INI file."""
+        """Saves the current configuration to the INI file.
+
+        Does nothing if no setting changed since the last load or save. The
+        file is written to a temporary sibling first and then swapped in, so
+        an interrupted write cannot leave a truncated config.ini behind.
+        """
+        if not self._dirty:
+            return
         self.config[CONFIG_SECTION_USER_PREFS] = self.user_prefs
         self.config[CONFIG_SECTION_PATHS] = self.paths
         self.config[CONFIG_SECTION_MISC] = self.misc
+        tmp_path = self.config_path.with_suffix('.ini.tmp')
         try:
-            with self.config_path.open('w') as configfile:
+            with tmp_path.open('w') as configfile:
                 self.config.write(configfile)
+            os.replace(tmp_path, self.config_path)
+            self._dirty = False
         except Exception as e:
-            logger.error(f"Error saving preferences: {e}")
-            
+            logger.error("Error saving preferences: %s", e)
+
     def get_path(self, key: str) -> Path:
         """Get full path for a configuration key.
 
@@ -71,18 +94,28 @@ class ConfigManager:
         Returns:
             Full path to the file
         """
-        return self.data_dir / self.paths.get(key, "")
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._path_cache[key] = self.data_dir / self.paths.get(key, "")
+        return path
 
-    def set_path(self, key: str, value: Union[str, Path]) -> None:
+    def set_path(self, key: str, value: Union[str, Path], save: bool = True) -> None:
         """Set a path in configuration.
 
         Args:
             key: Configuration key name
             value: Path or filename to store
+            save: Write the file now; pass False to batch several changes
+                into one later save()
         """
-        logger.debug(f"Setting path for {key} to {value}")
-        self.paths[key] = str(value) if isinstance(value, Path) else value
-        self.save()
+        logger.debug("Setting path for %s to %s", key, value)
+        value = str(value) if isinstance(value, Path) else value
+        if self.paths.get(key) != value:
+            self.paths[key] = value
+            self._path_cache.pop(key, None)
+            self._dirty = True
+        if save:
+            self.save()
 
     def get_user_pref(self, key: str, fallback: str = '') -> str:
         """Get user preference value.
@@ -97,15 +130,20 @@ class ConfigManager:
         user = self.user_prefs.get(key, fallback)
         return user if user != '' else fallback
 
-    def set_user_pref(self, key: str, value: str) -> None:
+    def set_user_pref(self, key: str, value: str, save: bool = True) -> None:
         """Set user preference value.
 
         Args:
             key: Preference key name
             value: Value to store
+            save: Write the file now; pass False to batch several changes
+                into one later save()
         """
-        self.user_prefs[key] = value
-        self.save()
+        if self.user_prefs.get(key) != value:
+            self.user_prefs[key] = value
+            self._dirty = True
+        if save:
+            self.save()
 
     def get_misc(self, key: str, fallback: str = '') -> str:
         """Get miscellaneous configuration value.
@@ -126,22 +164,21 @@ class ConfigManager:
             key: Configuration key
             value: Value to store
         """
-        self.misc[key] = value
+        if self.misc.get(key) != value:
+            self.misc[key] = value
+            self._dirty = True
         self.save()
 
     def _set_defaults(self) -> None:
         """Sets default values for a fresh configuration."""
         self.user_prefs = {'author': '', 'site': '', 'activity': '', 'camera': ''}
+        self._dirty = True
         self._set_default_paths()
         self.save()
 
     def _set_default_paths(self) -> None:
         """Set default file paths using constants."""
-        self.paths = {
-            'species': DEFAULT_SPECIES_FILE,
-            'photographers': DEFAULT_PHOTOGRAPHERS_FILE,
-            'divesites': DEFAULT_DIVESITES_FILE,
-            'activities': DEFAULT_ACTIVITIES_FILE,
-            'labels': DEFAULT_LABELS_FILE
-        }
+        self.paths = dict(_DEFAULT_PATHS)
+        self._path_cache.clear()
+        self._dirty = True
         self.save()
\ No newline at end of file
@@ -34,35 +34,46 @@ TREE_COLUMNS = ['Family', 'Genus', 'Species', 'Species English']
 # Supports optional _N (no GPS) or _G (GPS present) suffix
 PATTERN_BASIC_FILENAME = re.compile(
     r'^[A-Za-z]{5}_'                    # Author code (5 letters)
-    r'[A-Z]{3}-[A-Za-z]+-[A-Z0-9]{3}_'  # Site string
+    r'[A-Z]{3}-[A-Za-z]++-[A-Z0-9]{3}_' # Site string
     r'\d{4}-\d{2}-\d{2}_'               # Date (YYYY-MM-DD)
     r'\d{2}-\d{2}-\d{2}_'               # Time (HH-MM-SS)
-    r'[A-Za-z]+_'                       # Activity
-    r'[A-Z]-[A-Za-z0-9]+_'              # Camera (REQUIRED: uppercase-alphanumeric)
-    r'[A-Za-z0-9]+'                     # Original filename
-    r'(?:_[NG])?$'                      # Optional _N or _G suffix
+    r'[A-Za-z]++_'                      # Activity
+    r'[A-Z]-[A-Za-z0-9]++_'             # Camera (REQUIRED: uppercase-alphanumeric)
+    r'[A-Za-z0-9]++'                    # Original filename
+    r'(?:_[NG])?\Z'                     # Optional _N or _G suffix
 )
 
+# Fewest '_' separators a name needs to match the basic / identity pattern;
+# checked first so unprocessed names skip the regexes entirely
+MIN_UNDERSCORES_BASIC = 6
+MIN_UNDERSCORES_IDENTITY = 14
+
 # Identity filename pattern: Full taxonomy + basic fields
 # Example: Pomacentridae_Amphiprion_clarkii_B_ok_ad_ty_zz_ABCDE_ABC-Location-123_2024-01-15_14-30-45_diving_S-A7IV_IMG001
 # Supports optional _N (no GPS) or _G (GPS present) suffix
 PATTERN_IDENTITY_FILENAME = re.compile(
-    r'(0?\-?[A-Za-z]*)_'                       # Family (group 1)
-    r'([A-Za-z]+)_'                            # Genus (group 2)
-    r'([a-z]+)_'                               # Species (group 3)
+    r'(0?+\-?+[A-Za-z]*+)_'                    # Family (group 1)
+    r'([A-Za-z]++)_'                           # Genus (group 2)
+    r'([a-z]++)_'                              # Species (group 3)
     r'[A-Z]_'                                  # Separator 'B'
     r'([a-z]{2})_'                             # Confidence (group 4)
-    r'([A-Za-z]+)_'                            # Phase (group 5)
-    r'([A-Za-z\-]+)_'                          # Colour (group 6)
-    r'([A-Za-z\-]+)_'                          # Behaviour (group 7)
+    r'([A-Za-z]++)_'                           # Phase (group 5)
+    r'([-A-Za-z]++)_'                          # Colour (group 6)
+    r'([-A-Za-z]++)_'                          # Behaviour (group 7)
     r'([A-Za-z]{5})_'                          # Author code (group 8)
-    r'([A-Z]{3}-[A-Za-z]+-[A-Z0-9]{3})_'       # Site string (group 9)
+    r'([A-Z]{3}-[A-Za-z]++-[A-Z0-9]{3})_'      # Site string (group 9)
     r'(\d{4}-\d{2}-\d{2})_'                    # Date (group 10)
     r'(\d{2}-\d{2}-\d{2})_'                    # Time (group 11)
-    r'([A-Za-z]+)_'                            # Activity (group 12)
-    r'([A-Z]-[A-Za-z0-9]+)_'                   # Camera (group 13, REQUIRED)
+    r'([A-Za-z]++)_'                           # Activity (group 12)
+    r'([A-Z]-[A-Za-z0-9]++)_'                  # Camera (group 13, REQUIRED)
     r'(.*?)'                                   # Original name (group 14)
-    r'(?:_[NG])?$'                             # Optional _N or _G suffix (non-capturing)
+    r'(?:_[NG])?\Z'                            # Optional _N or _G suffix (non-capturing)
+)
+
+# Names of the 14 identity pattern groups, in group order
+IDENTITY_FIELD_NAMES = (
+    'family', 'genus', 'species', 'confidence', 'phase', 'colour', 'behaviour',
+    'author_code', 'site_string', 'date', 'time', 'activity', 'camera', 'filename'
 )
 
 # Pattern to extract base name from identity filename
@@ -70,15 +81,22 @@ PATTERN_BASIC_BASENAME = re.compile(
     r'([A-Za-z]{5}_.*?_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}_.*)'
 )
 
-# Pattern to extract datetime from filename
-PATTERN_DATETIME_IN_FILENAME = re.compile(
-    r'0?\-?[A-Za-z]*_[A-Za-z]+_[a-z]+_[A-Z]_[a-z]{2}_[A-Za-z]+_[A-Za-z\-]+_[A-Za-z\-]+_'
-    r'[A-Za-z]{5}_[A-Z]{3}-[A-Za-z]+-[A-Z0-9]{3}_'
-    r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})_'  # Date-time (group 1)
-    r'[A-Za-z]+_'
-    r'([A-Za-z0-9]+)'                          # Original name (group 2)
+# Pattern to validate a site string on its own: XXX-Name-XXX
+# Example: IDN-Bangka-BTI
+PATTERN_SITE_STRING = re.compile(
+    r'^[A-Z]{3}-[A-Za-z]++-[A-Z0-9]{3}\Z'
 )
 
+# Pattern to extract the YYYY-MM-DD version date from a data file name
+PATTERN_FILE_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Pattern to extract the location from a remote (URL-encoded) data file name
+# Example: Species_Red%20Sea%202025-04-15.csv -> 'Red%20Sea'
+PATTERN_REMOTE_FILE_LOCATION = re.compile(r'_(.+?)%20\d{4}-\d{2}-\d{2}')
+
+# Pattern to extract the data type prefix (e.g. 'Species', 'Labels') from a data file name
+PATTERN_DATA_FILE_PREFIX = re.compile(r'[A-Za-z]+')
+
 # ==============================================================================
 # UI Constants
 # ==============================================================================
@@ -94,10 +112,21 @@ PREFERENCES_WINDOW_TITLE = "Preferences & Updates"
 # Search placeholder
 SEARCH_PLACEHOLDER = "Search by family, genus, species, or common name..."
 
+# Species tree rows inserted per event-loop pass; the first chunk is shown at once
+TREE_FILL_CHUNK = 200
+
 # Status messages
 STATUS_READY = "Ready"
 STATUS_IDLE = "Status: Idle"
 
+# Status bar hint shown for each mode
+MODE_HINTS = {
+    'Basic': "Drop files to add photographer, site, and activity info",
+    'Identify': "Search or select a species, then drop files to identify",
+    'Edit': "Drop files to batch edit their metadata",
+    'Meta': "Drop Basic/Identify format files to auto-extract GPS from filename"
+}
+
 # ==============================================================================
 # File Extensions
 # ==============================================================================
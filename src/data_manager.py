@@ -2,7 +2,10 @@
 import csv
 import json
 import logging
-from typing import Optional, List, Tuple
+import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, List, Tuple
 from .constants import (
     DEFAULT_FAMILY, DEFAULT_GENUS, DEFAULT_SPECIES,
     DEFAULT_CONFIDENCE, DEFAULT_PHASE, DEFAULT_COLOUR, DEFAULT_BEHAVIOUR
@@ -10,6 +13,54 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+# Data file key -> (attribute it is loaded into, status message)
+LOAD_MAP = {
+    'species': ('fish_df_raw', 'Loaded species data'),
+    'photographers': ('users_df', 'Loaded photographers'),
+    'divesites': ('divesites_df_raw', 'Loaded divesites'),
+    'activities': ('activities_df', 'Loaded activities'),
+    'labels': ('labels', 'Loaded labels'),
+}
+
+# Low-cardinality columns whose values are interned on load, so repeated
+# names share one string object and compare by identity first
+INTERNED_COLUMNS = {
+    'species': ('Family', 'Genus'),
+    'photographers': ('Namecode',),
+    'divesites': ('Area', 'Site'),
+}
+
+
+def _read_csv_rows(path) -> List[dict]:
+    """Read a semicolon-separated CSV file into a list of dicts.
+
+    Uses csv.reader and zips each row against the header, which avoids the
+    per-row bookkeeping of csv.DictReader. Short rows are padded with ''
+    and blank lines are skipped, as DictReader(restval='') would.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        List of row dicts keyed by the header columns
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f, delimiter=';')
+        header = next(reader, None)
+        if not header:
+            return []
+        width = len(header)
+        padding = [''] * width
+        rows = []
+        for values in reader:
+            if not values:
+                continue
+            if len(values) < width:
+                values += padding[len(values):]
+            rows.append(dict(zip(header, values)))
+    return rows
+
+
 class DataManager:
     """Loads and manages all application data from CSV files."""
     def __init__(self, config_manager):
@@ -24,6 +75,25 @@ class DataManager:
         self.labels = {}
         self.colour_reverse = {}
         self.behaviour_reverse = {}
+        self._site_list_cache: Optional[List[str]] = None
+        self._all_fish_cache: Optional[List[list]] = None
+        self._unique_cache: Dict[Tuple[str, str], List[str]] = {}
+        self._fish_choices_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+        # Hash lookups rebuilt whenever the data is (re)filtered
+        self._code_by_name = {}
+        self._name_by_code = {}
+        self._sitestring_by_area_site = {}
+        self._site_label_by_sitestring = {}
+        self._coords_by_area_site = {}
+        self._coords_by_site_label = {}
+        self._fish_by_col: Optional[dict] = None
+        self._fish_haystacks: Optional[List[Tuple[str, dict]]] = None
+        self._last_search: Optional[Tuple[List[str], List[Tuple[str, dict]]]] = None
+        self._camera_abbrev_by_name = {}
+        self._label_abbrevs = {}
+        self._label_names = {}
+        self._label_abbrev_by_name = {}
 
         self._fish_columns = ['Family', 'Genus', 'Species', 'Species English']
 
@@ -37,31 +107,41 @@ class DataManager:
         self.behaviour_default = DEFAULT_BEHAVIOUR
         self.location = self.config_manager.get_misc('location', '')
 
-    def load_all_data(self) -> str:
+    def read_data_files(self) -> Dict[str, Future]:
+        """Read all configured data files without applying them.
+
+        Only reads files, so it can run on a worker thread while the UI is
+        built. Pass the result to load_all_data().
+
+        Returns:
+            Dict mapping each data key to the completed Future of its read
+        """
+        # One directory listing replaces an exists() stat per data file
+        try:
+            with os.scandir(self.config_manager.data_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        # Read the files concurrently; results are applied in LOAD_MAP order
+        with ThreadPoolExecutor(max_workers=len(LOAD_MAP)) as executor:
+            return {key: executor.submit(self._load_file, key, present) for key in LOAD_MAP}
+
+    def load_all_data(self, files: Optional[Dict[str, Future]] = None) -> str:
         """Loads all CSVs into list-of-dicts based on paths from config.
 
+        Args:
+            files: Result of read_data_files(), if the files were already read
+
         Returns:
             Status message string describing what was loaded
         """
-        load_map = {
-            'species': ('fish_df_raw', 'Loaded species data'),
-            'photographers': ('users_df', 'Loaded photographers'),
-            'divesites': ('divesites_df_raw', 'Loaded divesites'),
-            'activities': ('activities_df', 'Loaded activities'),
-            'labels': ('labels', 'Loaded labels'),
-        }
+        if files is None:
+            files = self.read_data_files()
         messages = []
-        for key, (attr, msg) in load_map.items():
+        for key, (attr, msg) in LOAD_MAP.items():
             try:
-                path = self.config_manager.get_path(key)
-                if path.exists():
-                    if key == 'labels':
-                        with open(path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                    else:
-                        with open(path, 'r', encoding='utf-8-sig') as f:
-                            reader = csv.DictReader(f, delimiter=';')
-                            data = [{k: (v or '') for k, v in row.items()} for row in reader]
+                path, data = files[key].result()
+                if data is not None:
                     setattr(self, attr, data)
 
                     messages.append(f"{msg} from {path.name}")
@@ -73,6 +153,47 @@ class DataManager:
         self.filter_by_location()
         return "\n".join(messages)
 
+    def _load_file(self, key: str, present: set):
+        """Read a single data file configured under the given key.
+
+        Runs on a worker thread, so it only reads and returns the data.
+
+        Args:
+            key: Config path key (e.g., 'species', 'labels')
+            present: File names currently in the data directory
+
+        Returns:
+            Tuple of (path, data), with data None if the file does not exist
+        """
+        path = self.config_manager.get_path(key)
+        if path.parent == self.config_manager.data_dir:
+            exists = path.name in present
+        else:
+            exists = path.exists()
+        if not exists:
+            return path, None
+        if key == 'labels':
+            with open(path, 'r', encoding='utf-8') as f:
+                return path, json.load(f)
+        data = _read_csv_rows(path)
+        self._intern_columns(data, INTERNED_COLUMNS.get(key, ()))
+        return path, data
+
+    @staticmethod
+    def _intern_columns(rows: List[dict], columns: Tuple[str, ...]) -> None:
+        """Intern the values of the given columns in place.
+
+        Args:
+            rows: Loaded CSV rows
+            columns: Column names holding heavily repeated strings
+        """
+        if not rows:
+            return
+        columns = [col for col in columns if col in rows[0]]
+        for row in rows:
+            for col in columns:
+                row[col] = sys.intern(row[col])
+
     def _set_defaults_from_labels(self) -> None:
         """Set attribute defaults from the first entry in each label category.
 
@@ -124,17 +245,107 @@ class DataManager:
             else:
                 filtered = [{col: row[col] for col in columns} for row in raw_rows]
             setattr(self, df_attr_loc, filtered)
+        self._site_list_cache = None
+        self._all_fish_cache = None
+        self._unique_cache.clear()
+        self._fish_choices_cache.clear()
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Build dict lookups used by the per-selection accessors.
+
+        The first matching row wins, mirroring the previous linear scans.
+        """
+        self._code_by_name = {}
+        self._name_by_code = {}
+        for row in self.users_df:
+            name, code = str(row.get('Full name', '')), str(row.get('Namecode', ''))
+            self._code_by_name.setdefault(name, code)
+            self._name_by_code.setdefault(code, name)
+
+        self._sitestring_by_area_site = {}
+        self._site_label_by_sitestring = {}
+        self._coords_by_area_site = {}
+        self._coords_by_site_label = {}
+        for row in self.divesites_df:
+            area_site = (row['Area'], row['Site'])
+            # 'Area, Site' label as shown in the UI, built once per site row
+            label = f"{row['Area']}, {row['Site']}"
+            try:
+                coords = (float(row['latitude']), float(row['longitude']))
+            except ValueError:
+                # Keep the raw values so lookups report the bad coordinates
+                coords = (row['latitude'], row['longitude'])
+            self._sitestring_by_area_site.setdefault(area_site, str(row['Site string']))
+            self._site_label_by_sitestring.setdefault(row['Site string'], label)
+            self._coords_by_area_site.setdefault(area_site, coords)
+            self._coords_by_site_label.setdefault(label, coords)
+
+        # The per-column fish index and search haystacks are built on first use
+        self._fish_by_col = None
+        self._fish_haystacks = None
+        self._last_search = None
+
+        self._camera_abbrev_by_name = {}
+        for abbrev, name in self.labels.get('Camera', {}).items():
+            self._camera_abbrev_by_name.setdefault(name, abbrev)
+
+        # Immutable per-category choice tuples, shared by every combobox refresh
+        categories = {category: entries for category, entries in self.labels.items() if isinstance(entries, dict)}
+        self._label_abbrevs = {category: tuple(entries) for category, entries in categories.items()}
+        self._label_names = {category: tuple(entries.values()) for category, entries in categories.items()}
+        self._label_abbrev_by_name = {
+            category: {name: abbrev for abbrev, name in entries.items()}
+            for category, entries in categories.items()
+        }
+
+    def _get_fish_index(self) -> dict:
+        """Return the {column: {value: [rows]}} fish index, building it on first use.
+
+        Returns:
+            Dict of per-column value buckets for Family, Genus and Species
+        """
+        if self._fish_by_col is None:
+            fish_by_col = {col: {} for col in ('Family', 'Genus', 'Species')}
+            for row in self.fish_df:
+                for col, index in fish_by_col.items():
+                    index.setdefault(row[col], []).append(row)
+            self._fish_by_col = fish_by_col
+        return self._fish_by_col
+
+    def _get_fish_haystacks(self) -> List[Tuple[str, list]]:
+        """Return (lowercased haystack, display values) pairs for search, building them on first use.
+
+        Each haystack joins the row's lowercased values with newlines. Search
+        terms come from str.split() and never contain whitespace, so a term
+        found in the haystack always lies within a single column value.
+
+        The pairs are kept in taxonomy order, so filtering them already yields
+        sorted results.
+
+        Returns:
+            List of (haystack, values) tuples sorted by Family, Genus, Species
+        """
+        if self._fish_haystacks is None:
+            sorted_rows = sorted(self.fish_df, key=lambda r: (r['Family'], r['Genus'], r['Species']))
+            self._fish_haystacks = [
+                ('\n'.join(str(v) for v in row.values()).lower(), [row[c] for c in self._fish_columns])
+                for row in sorted_rows
+            ]
+        return self._fish_haystacks
 
     def get_all_fish(self) -> List[list]:
         """Get all fish data sorted by taxonomy.
 
+        The sorted list is computed once per (re)filter and reused afterwards.
+
         Returns:
             List of lists sorted by Family, Genus, Species
         """
-        if not self.fish_df:
-            return []
-        sorted_rows = sorted(self.fish_df, key=lambda r: (r['Family'], r['Genus'], r['Species']))
-        return [[row[c] for c in self._fish_columns] for row in sorted_rows]
+        if self._all_fish_cache is None:
+            sorted_rows = sorted(self.fish_df, key=lambda r: (r['Family'], r['Genus'], r['Species']))
+            self._all_fish_cache = [[row[c] for c in self._fish_columns] for row in sorted_rows]
+        return self._all_fish_cache
 
     def get_unique_values(self, column: str, df_attr: str = 'fish_df') -> List[str]:
         """Get unique values from a data column.
@@ -146,10 +357,18 @@ class DataManager:
         Returns:
             Sorted list of unique values
         """
+        key = (df_attr, column)
+        cached = self._unique_cache.get(key)
+        if cached is not None:
+            return cached
+
         data = getattr(self, df_attr)
         if data and column in data[0]:
-            return sorted(set(row[column] for row in data))
-        return []
+            values = sorted(set(row[column] for row in data))
+        else:
+            values = []
+        self._unique_cache[key] = values
+        return values
 
     def get_abbreviation_reverse(self, category: str, label: str) -> str:
         """Get the abbreviation for a label in a category.
@@ -161,35 +380,36 @@ class DataManager:
         Returns:
             Abbreviated label, or empty string if not found
         """
-        category_dict = self.labels.get(category, {})
-        reverse_dict = {v: k for k, v in category_dict.items()}
-        return reverse_dict.get(label, '')
+        return self._label_abbrev_by_name.get(category, {}).get(label, '')
 
-    def get_active_label_abbrevs(self, category: str) -> List[str]:
-        """Get list of active label keys for a category.
+    def get_active_label_abbrevs(self, category: str) -> Tuple[str, ...]:
+        """Get the active label keys for a category.
 
         Args:
             category: Category name (e.g., 'Confidence', 'Phase')
 
         Returns:
-            List of label abbreviations
+            Tuple of label abbreviations
         """
-        return list(self.labels.get(category, {}).keys())
+        return self._label_abbrevs.get(category, ())
 
-    def get_active_labels(self, category: str) -> List[str]:
-        """Get list of active label keys for a category.
+    def get_active_labels(self, category: str) -> Tuple[str, ...]:
+        """Get the active label names for a category.
 
         Args:
             category: Category name (e.g., 'Confidence', 'Phase')
 
         Returns:
-            List of label abbreviations
+            Tuple of full label names
         """
-        return list(self.labels.get(category, {}).values())
+        return self._label_names.get(category, ())
 
     def filter_fish(self, filters: dict[str, str] = None) -> list[dict]:
         """Filter fish data by multiple column values.
 
+        Starts from the smallest indexed bucket among the filter columns and
+        only checks the remaining conditions on those rows.
+
         Args:
             filters: Dictionary of {column_name: value} pairs to filter by
 
@@ -199,7 +419,11 @@ class DataManager:
         if not filters:
             return self.fish_df
 
-        return [row for row in self.fish_df if all(row.get(col) == val for col, val in filters.items())]
+        fish_by_col = self._get_fish_index()
+        buckets = [fish_by_col[col].get(val, []) for col, val in filters.items() if col in fish_by_col]
+        candidates = min(buckets, key=len) if buckets else self.fish_df
+
+        return [row for row in candidates if all(row.get(col) == val for col, val in filters.items())]
 
     def search_fish(self, search_string: str) -> List[list]:
         """Search fish data by multiple keywords.
@@ -221,13 +445,44 @@ class DataManager:
         if not self.fish_df:
             return []
 
-        matched = [row for row in self.fish_df if all(
-            any(sub in str(v).lower() for v in row.values())
-            for sub in search_substrings
-        )]
+        # While typing, each query usually refines the previous one: when every
+        # previous term is part of some new term, only its matches can match
+        candidates = self._get_fish_haystacks()
+        if self._last_search is not None:
+            last_terms, last_matches = self._last_search
+            if all(any(old in new for new in search_substrings) for old in last_terms):
+                candidates = last_matches
+
+        matches = [(haystack, values) for haystack, values in candidates
+                   if all(sub in haystack for sub in search_substrings)]
+        self._last_search = (search_substrings, matches)
+        # Candidates are in taxonomy order, so the matches need no sorting
+        return [values for _, values in matches]
+
+    def get_fish_choices(self, family: Optional[str] = None,
+                         genus: Optional[str] = None) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Get the genus and species combobox choices under a family/genus selection.
+
+        Each tuple starts with the matching default placeholder followed by the
+        sorted values, ready to assign to a combobox. Results are cached per
+        selection until the data is re-filtered.
+
+        Args:
+            family: Family to filter by, or None for all fish
+            genus: Genus to filter by, or None for the whole family
 
-        sorted_rows = sorted(matched, key=lambda r: (r['Family'], r['Genus'], r['Species']))
-        return [[row[c] for c in self._fish_columns] for row in sorted_rows]
+        Returns:
+            Tuple of (genus_choices, species_choices)
+        """
+        key = (family, genus)
+        cached = self._fish_choices_cache.get(key)
+        if cached is None:
+            filters = {col: val for col, val in (('Family', family), ('Genus', genus)) if val is not None}
+            rows = self.filter_fish(filters)
+            cached = ((self.genus_default, *self.unique_column(rows, 'Genus')),
+                      (self.species_default, *self.unique_column(rows, 'Species')))
+            self._fish_choices_cache[key] = cached
+        return cached
 
     @staticmethod
     def to_values(rows):
@@ -251,17 +506,10 @@ class DataManager:
         Returns:
             Formatted 'Area, Site' string, or None if not found
         """
-        if not self.divesites_df or not site_string:
+        if not site_string:
             return None
 
-        try:
-            result = next((row for row in self.divesites_df if row['Site string'] == site_string), None)
-            if result:
-                return f"{result['Area']}, {result['Site']}"
-        except (KeyError, IndexError) as e:
-            logger.error(f"Error retrieving site for '{site_string}': {e}")
-
-        return None
+        return self._site_label_by_sitestring.get(site_string)
 
     def get_divesite_string(self, area: str, site: str) -> str:
         """Get site string identifier from area and site names.
@@ -273,17 +521,10 @@ class DataManager:
         Returns:
             Site string identifier, or empty string if not found
         """
-        if not self.divesites_df or not area or not site:
+        if not area or not site:
             return ""
 
-        try:
-            result = next((row for row in self.divesites_df if row['Area'] == area and row['Site'] == site), None)
-            if result:
-                return str(result['Site string'])
-        except (KeyError, IndexError) as e:
-            logger.error(f"Error retrieving site string for '{area}, {site}': {e}")
-
-        return ""
+        return self._sitestring_by_area_site.get((area, site), "")
 
     def get_user_code(self, full_name: str) -> str:
         """Get user code from full name.
@@ -294,17 +535,10 @@ class DataManager:
         Returns:
             User code, or empty string if not found
         """
-        if not self.users_df or not full_name:
+        if not full_name:
             return ""
 
-        try:
-            result = next((row for row in self.users_df if row['Full name'] == full_name), None)
-            if result:
-                return str(result['Namecode'])
-        except (KeyError, IndexError) as e:
-            logger.error(f"Error retrieving user code for '{full_name}': {e}")
-
-        return ""
+        return self._code_by_name.get(full_name, "")
 
     def get_user_name(self, code: str) -> str:
         """Get full name from user code.
@@ -315,29 +549,35 @@ class DataManager:
         Returns:
             Full name, or empty string if not found
         """
-        if not self.users_df or not code:
+        if not code:
             return ""
 
-        try:
-            result = next((row for row in self.users_df if row['Namecode'] == code), None)
-            if result:
-                return str(result['Full name'])
-        except (KeyError, IndexError) as e:
-            logger.error(f"Error retrieving user name for code '{code}': {e}")
-
-        return ""
+        return self._name_by_code.get(code, "")
 
     def get_formatted_site_list(self) -> List[str]:
         """Returns a sorted list of sites formatted as 'Area, Site'.
 
+        The list is built once per divesites (re)filter and reused afterwards.
+
         Returns:
             List of formatted site strings
         """
-        if not self.divesites_df:
-            return []
+        if self._site_list_cache is None:
+            sorted_rows = sorted(self.divesites_df, key=lambda r: (r['Area'], r['Site']))
+            self._site_list_cache = [f"{r['Area']}, {r['Site']}" for r in sorted_rows]
+        return self._site_list_cache
+
+    def get_lat_long(self, area: str, site: str) -> Tuple[Optional[float], Optional[float]]:
+        """Returns the latitude and longitude for a given area and site.
+
+        Args:
+            area: Geographic area name
+            site: Specific dive site name
 
-        sorted_rows = sorted(self.divesites_df, key=lambda r: (r['Area'], r['Site']))
-        return [f"{r['Area']}, {r['Site']}" for r in sorted_rows]
+        Returns:
+            Tuple of (latitude, longitude) or (None, None) if not found
+        """
+        return self._parse_coords(self._coords_by_area_site.get((area, site)), f"{area}, {site}")
 
     def get_lat_long_from_site(self, site_string: str) -> Tuple[Optional[float], Optional[float]]:
         """Returns the latitude and longitude for a given site string.
@@ -349,24 +589,32 @@ class DataManager:
             Tuple of (latitude, longitude) or (None, None) if not found
         """
         if not site_string or ', ' not in site_string:
-            logger.warning(f"Invalid site string format: '{site_string}'")
+            logger.warning("Invalid site string format: '%s'", site_string)
             return (None, None)
 
-        try:
-            location, site = site_string.split(", ", 1)
+        return self._parse_coords(self._coords_by_site_label.get(site_string), site_string)
 
-            if not self.divesites_df:
-                return (None, None)
+    @staticmethod
+    def _parse_coords(coords: Optional[tuple], site_label: str) -> Tuple[Optional[float], Optional[float]]:
+        """Return an indexed (latitude, longitude) pair as floats.
 
-            result = next((row for row in self.divesites_df if row['Area'] == location and row['Site'] == site), None)
+        Valid pairs are already converted when the index is built.
 
-            if not result:
-                logger.warning(f"No coordinates found for site: '{site_string}'")
-                return (None, None)
+        Args:
+            coords: Coordinate pair from an index, or None if not found
+            site_label: 'Area, Site' label used in log messages
 
-            return (float(result['latitude']), float(result['longitude']))
-        except (ValueError, KeyError, IndexError) as e:
-            logger.error(f"Error extracting coordinates for '{site_string}': {e}")
+        Returns:
+            Tuple of (latitude, longitude) or (None, None) if missing or invalid
+        """
+        if not coords:
+            logger.warning("No coordinates found for site: '%s'", site_label)
+            return (None, None)
+
+        try:
+            return (float(coords[0]), float(coords[1]))
+        except (ValueError, IndexError) as e:
+            logger.error("Error extracting coordinates for '%s': %s", site_label, e)
 
         return (None, None)
 
@@ -399,12 +647,7 @@ class DataManager:
         Returns:
             Camera abbreviation (e.g., 'S-A7IV'), or empty string if not found
         """
-        if 'Camera' not in self.labels:
-            return ''
-        for abbrev, name in self.labels['Camera'].items():
-            if name == full_name:
-                return abbrev
-        return ''
+        return self._camera_abbrev_by_name.get(full_name, '')
 
     def get_camera_full_name(self, abbrev: str) -> str:
         """Get full name from camera abbreviation.
@@ -1,14 +1,25 @@
 # exif_handler.py
-from PIL import Image
-from pillow_heif import register_heif_opener
-register_heif_opener()
-
-import exifread
 import logging
+import os
+from functools import lru_cache
 from .constants import EXIF_TAG_DATETIME_ORIGINAL, EXIF_TAG_DATETIME
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _register_heif_opener() -> None:
+    """Register the HEIF/HEIC plugin with Pillow once, on first use."""
+    from pillow_heif import register_heif_opener
+    register_heif_opener()
+
+
+@lru_cache(maxsize=1024)
+def _read_exif_date(handler: 'ExifHandler', path: str, mtime_ns: int) -> str:
+    """Cached EXIF date read; mtime_ns in the key drops entries for edited files."""
+    return handler._extract_creation_date(path)
+
+
 class ExifHandler:
     """Handles reading EXIF metadata, specifically the creation date, from images."""
 
@@ -23,21 +34,33 @@ class ExifHandler:
         Returns:
             Formatted date string, or empty string if extraction fails
         """
-        # Try with Pillow first (faster and more reliable with modern API)
-        date_str = self._get_date_from_pillow(path)
+        # Previews and renames read the same files repeatedly; serve those from cache
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return self._extract_creation_date(path)
+        return _read_exif_date(self, os.path.normpath(path), mtime_ns)
+
+    def _extract_creation_date(self, path: str) -> str:
+        """Read the creation date from the file without caching."""
+        # Try exifread first: it only parses the header up to the date tag
+        date_str = self._get_date_from_exifread(path)
         if date_str:
             return date_str
 
-        # Fallback to exifread library
-        date_str = self._get_date_from_exifread(path)
+        # Fallback to Pillow (covers HEIF/HEIC via pillow_heif)
+        date_str = self._get_date_from_pillow(path)
         if date_str:
             return date_str
 
-        logger.warning(f"Could not extract EXIF date from {path}")
+        logger.warning("Could not extract EXIF date from %s", path)
         return ""
 
     def _get_date_from_pillow(self, path: str) -> str:
-        """Extract date using Pillow library."""
+        """Extract date using Pillow library as fallback."""
+        from PIL import Image  # Deferred until exifread first comes up empty
+        _register_heif_opener()
+
         try:
             with Image.open(path) as img:
                 # Use public API instead of deprecated _getexif()
@@ -53,15 +76,21 @@ class ExifHandler:
                     if datetime_str:
                         return self._format_datetime(datetime_str)
         except (IOError, OSError, AttributeError, KeyError) as e:
-            logger.debug(f"Pillow EXIF extraction failed for {path}: {e}")
+            logger.debug("Pillow EXIF extraction failed for %s: %s", path, e)
 
         return ""
 
     def _get_date_from_exifread(self, path: str) -> str:
-        """Extract date using exifread library as fallback."""
+        """Extract date using exifread library.
+
+        stop_tag is matched against the bare tag name, so parsing ends at
+        DateTimeOriginal; IFD0 (with Image DateTime) is read before that.
+        """
+        import exifread  # Deferred until the first EXIF read
+
         try:
             with open(path, 'rb') as f:
-                tags = exifread.process_file(f, details=False, stop_tag='EXIF DateTimeOriginal')
+                tags = exifread.process_file(f, details=False, stop_tag='DateTimeOriginal')
 
                 # Try DateTimeOriginal first
                 if 'EXIF DateTimeOriginal' in tags:
@@ -70,8 +99,9 @@ class ExifHandler:
                 # Fallback to Image DateTime
                 if 'Image DateTime' in tags:
                     return self._format_datetime(str(tags['Image DateTime']))
-        except (IOError, OSError) as e:
-            logger.debug(f"exifread extraction failed for {path}: {e}")
+        except Exception as e:
+            # Malformed headers can raise anything; Pillow is tried next
+            logger.debug("exifread extraction failed for %s: %s", path, e)
 
         return ""
 
@@ -91,5 +121,5 @@ class ExifHandler:
             # Then replace remaining colons with dashes (time part)
             return datetime_str.replace(':', '-', 2).replace(' ', '_').replace(':', '-')
         except (AttributeError, ValueError) as e:
-            logger.warning(f"Failed to format datetime string '{datetime_str}': {e}")
+            logger.warning("Failed to format datetime string '%s': %s", datetime_str, e)
             return ""
\ No newline at end of file
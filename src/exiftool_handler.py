@@ -54,7 +54,7 @@ class ExifToolHandler:
         
         if path:
             self._exiftool_path = path
-            logger.info(f"Found ExifTool in PATH: {path}")
+            logger.info("Found ExifTool in PATH: %s", path)
             return
 
         # Check local installation in app directory
@@ -69,7 +69,7 @@ class ExifToolHandler:
         for local_path in local_paths:
             if local_path.exists():
                 self._exiftool_path = str(local_path)
-                logger.info(f"Found local ExifTool: {self._exiftool_path}")
+                logger.info("Found local ExifTool: %s", self._exiftool_path)
                 return
 
         # Check common macOS installation paths (Homebrew, manual installs)
@@ -84,7 +84,7 @@ class ExifToolHandler:
             for mac_path in mac_paths:
                 if mac_path.exists():
                     self._exiftool_path = str(mac_path)
-                    logger.info(f"Found macOS ExifTool: {self._exiftool_path}")
+                    logger.info("Found macOS ExifTool: %s", self._exiftool_path)
                     return
 
         logger.warning("ExifTool not found")
@@ -125,7 +125,7 @@ class ExifToolHandler:
             return True
 
         except Exception as e:
-            logger.error(f"Failed to start ExifTool process: {e}")
+            logger.error("Failed to start ExifTool process: %s", e)
             self._process = None
             return False
 
@@ -182,7 +182,7 @@ class ExifToolHandler:
                 return "\n".join(output_lines)
 
             except Exception as e:
-                logger.error(f"ExifTool execution error: {e}")
+                logger.error("ExifTool execution error: %s", e)
                 # Try to restart on next call
                 self._process = None
                 return ""
@@ -210,7 +210,7 @@ class ExifToolHandler:
                     logger.warning("ExifTool process killed after timeout")
 
                 except Exception as e:
-                    logger.error(f"Error shutting down ExifTool: {e}")
+                    logger.error("Error shutting down ExifTool: %s", e)
                     try:
                         self._process.kill()
                     except:
@@ -242,7 +242,7 @@ class ExifToolHandler:
             output = self._execute("-ver")
             return output.strip() if output else None
         except Exception as e:
-            logger.error(f"Failed to get ExifTool version: {e}")
+            logger.error("Failed to get ExifTool version: %s", e)
             return None
 
     def refresh_availability(self) -> bool:
@@ -287,7 +287,7 @@ class ExifToolHandler:
             if match:
                 return match.group(1)
         except Exception as e:
-            logger.warning(f"Failed to fetch latest ExifTool version: {e}")
+            logger.warning("Failed to fetch latest ExifTool version: %s", e)
         return None
 
     @staticmethod
@@ -429,7 +429,7 @@ class ExifToolHandler:
                 return False, "Installation completed but ExifTool not detected. Please check manually."
 
         except Exception as e:
-            logger.error(f"ExifTool installation failed: {e}")
+            logger.error("ExifTool installation failed: %s", e)
             return False, f"Installation failed: {e}"
 
     def write_gps_coordinates(self, file_path: str, latitude: float, longitude: float) -> Tuple[bool, str]:
@@ -472,18 +472,18 @@ class ExifToolHandler:
 
             # Check for success indicators in output
             if "1 image files updated" in output or "1 image file updated" in output:
-                logger.debug(f"GPS written to {file_path}: {latitude}, {longitude}")
+                logger.debug("GPS written to %s: %s, %s", file_path, latitude, longitude)
                 return True, "GPS coordinates written successfully"
             elif "error" in output.lower() or "warning" in output.lower():
-                logger.error(f"ExifTool error: {output}")
+                logger.error("ExifTool error: %s", output)
                 return False, f"ExifTool error: {output}"
             else:
                 # Assume success if no error
-                logger.debug(f"GPS written to {file_path}: {latitude}, {longitude}")
+                logger.debug("GPS written to %s: %s, %s", file_path, latitude, longitude)
                 return True, "GPS coordinates written successfully"
 
         except Exception as e:
-            logger.error(f"Failed to write GPS: {e}")
+            logger.error("Failed to write GPS: %s", e)
             return False, f"Failed to write GPS: {e}"
 
     def read_gps_coordinates(self, file_path: str) -> Tuple[Optional[float], Optional[float]]:
@@ -525,7 +525,7 @@ class ExifToolHandler:
             return None, None
 
         except Exception as e:
-            logger.error(f"Failed to read GPS: {e}")
+            logger.error("Failed to read GPS: %s", e)
             return None, None
 
     # Maximum files per ExifTool batch to avoid command line length issues
@@ -615,11 +615,11 @@ class ExifToolHandler:
                                 results[file_path] = formatted
 
                 except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse ExifTool JSON output: {e}")
-                    logger.debug(f"JSON string was: {json_str[:200]}")
+                    logger.error("Failed to parse ExifTool JSON output: %s", e)
+                    logger.debug("JSON string was: %s", json_str[:200])
 
         except Exception as e:
-            logger.error(f"Failed to batch read creation dates: {e}")
+            logger.error("Failed to batch read creation dates: %s", e)
 
         return results
 
@@ -647,7 +647,7 @@ class ExifToolHandler:
             # Then replace remaining colons with dashes (time part)
             return datetime_str.replace(':', '-', 2).replace(' ', '_').replace(':', '-')
         except (AttributeError, ValueError) as e:
-            logger.warning(f"Failed to format datetime string '{datetime_str}': {e}")
+            logger.warning("Failed to format datetime string '%s': %s", datetime_str, e)
             return ""
 
     def batch_write_gps(self, file_coords_list: List[Tuple[str, float, float]],
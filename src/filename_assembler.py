@@ -1,5 +1,4 @@
 # filename_assembler.py
-import re
 import os
 import logging
 from typing import Optional, List, Tuple
@@ -7,7 +6,9 @@ from .constants import (
     PATTERN_BASIC_FILENAME,
     PATTERN_IDENTITY_FILENAME,
     PATTERN_BASIC_BASENAME,
-    PATTERN_DATETIME_IN_FILENAME
+    PATTERN_SITE_STRING,
+    MIN_UNDERSCORES_BASIC,
+    MIN_UNDERSCORES_IDENTITY
 )
 
 logger = logging.getLogger(__name__)
@@ -22,56 +23,48 @@ class FilenameAssembler:
         """Checks if a filename matches the basic or full processed format."""
         return PATTERN_BASIC_FILENAME.match(filename) is not None
 
-    def analyze_files_for_editing(self, filenames: List[str]) -> Tuple[list, list]:
-        """
-        Parses a list of filenames to find which metadata fields are identical across all files.
+    def parse_identity_files(self, filenames: List[str]) -> List[tuple]:
+        """Validate Identity format filenames and split them into their 14 fields.
 
         Args:
-            filenames: List of filenames to analyze
+            filenames: List of filenames to parse
 
         Returns:
-            Tuple of (is_same_flags, common_values) as lists
+            List of field tuples, in the same order as filenames
 
         Raises:
-            ValueError: If filenames don't match identity pattern
+            ValueError: If no filenames are given or one doesn't match the identity pattern
         """
         if not filenames:
             raise ValueError("No filenames provided for analysis")
 
+        match_identity = PATTERN_IDENTITY_FILENAME.match
         parsed_info = []
         for filename in filenames:
             basename = os.path.basename(os.path.splitext(filename)[0])
-            match = self.regex_match_identity(basename)
+            match = match_identity(basename)
 
             if not match:
-                logger.error(f"Filename does not match identity pattern: '{basename}'")
+                logger.error("Filename does not match identity pattern: '%s'", basename)
                 raise ValueError(f"Invalid filename format: '{basename}'")
 
             parsed_info.append(match.groups())
+        return parsed_info
 
-        try:
-            first = parsed_info[0]
-            num_fields = len(first)
-            is_same = [all(row[i] == first[i] for row in parsed_info) for i in range(num_fields)]
-            values = [first[i] if is_same[i] else None for i in range(num_fields)]
-            return is_same, values
-        except (IndexError, ValueError) as e:
-            logger.error(f"Error analyzing files for editing: {e}")
-            raise ValueError(f"Failed to analyze filenames: {e}")
+    def parse_basic_files(self, filenames: List[str]) -> List[tuple]:
+        """Split Basic format filenames into 14-field tuples.
 
-    def analyze_basic_files_for_editing(self, filenames: List[str]) -> Tuple[list, list]:
-        """
-        Parses a list of Basic format filenames to find which metadata fields are identical.
+        The tuples match the Identity format structure, with the 7 taxonomy
+        fields set to None.
 
         Args:
-            filenames: List of Basic format filenames to analyze
+            filenames: List of Basic format filenames to parse
 
         Returns:
-            Tuple of (is_same_flags, common_values) as lists with 14 elements
-            to match the Identity format structure (first 7 are None/False for taxonomy)
+            List of field tuples, in the same order as filenames
 
         Raises:
-            ValueError: If filenames don't match basic pattern
+            ValueError: If no filenames are given or one has too few fields
         """
         if not filenames:
             raise ValueError("No filenames provided for analysis")
@@ -102,20 +95,63 @@ class FilenameAssembler:
             parsed = (None, None, None, None, None, None, None,
                      author_code, site_string, date, time, activity, camera, original_name)
             parsed_info.append(parsed)
+        return parsed_info
+
+    def analyze_files_for_editing(self, filenames: List[str],
+                                  parsed_info: Optional[List[tuple]] = None) -> Tuple[list, list]:
+        """
+        Parses a list of filenames to find which metadata fields are identical across all files.
+
+        Args:
+            filenames: List of filenames to analyze
+            parsed_info: Result of parse_identity_files(filenames), if already available
+
+        Returns:
+            Tuple of (is_same_flags, common_values) as lists
+
+        Raises:
+            ValueError: If filenames don't match identity pattern
+        """
+        if parsed_info is None:
+            parsed_info = self.parse_identity_files(filenames)
 
         try:
-            first = parsed_info[0]
-            is_same = [False] * 14
+            # Transpose once and compare whole columns; tuple.count runs in C
+            is_same = [column.count(column[0]) == len(column) for column in zip(*parsed_info)]
+            values = [value if same else None for value, same in zip(parsed_info[0], is_same)]
+            return is_same, values
+        except (IndexError, ValueError) as e:
+            logger.error("Error analyzing files for editing: %s", e)
+            raise ValueError(f"Failed to analyze filenames: {e}")
+
+    def analyze_basic_files_for_editing(self, filenames: List[str],
+                                        parsed_info: Optional[List[tuple]] = None) -> Tuple[list, list]:
+        """
+        Parses a list of Basic format filenames to find which metadata fields are identical.
+
+        Args:
+            filenames: List of Basic format filenames to analyze
+            parsed_info: Result of parse_basic_files(filenames), if already available
+
+        Returns:
+            Tuple of (is_same_flags, common_values) as lists with 14 elements
+            to match the Identity format structure (first 7 are None/False for taxonomy)
+
+        Raises:
+            ValueError: If filenames don't match basic pattern
+        """
+        if parsed_info is None:
+            parsed_info = self.parse_basic_files(filenames)
 
+        try:
             # Check which fields are the same across all files (skip taxonomy fields 0-6)
-            for i in range(7, 14):
-                if all(row[i] == first[i] for row in parsed_info):
-                    is_same[i] = True
+            columns = list(zip(*parsed_info))
+            is_same = [False] * 7 + [column.count(column[0]) == len(column) for column in columns[7:]]
 
-            values = [first[i] if is_same[i] else None for i in range(14)]
+            values = [value if same else None for value, same in zip(parsed_info[0], is_same)]
             return is_same, values
         except (IndexError, ValueError) as e:
-            logger.error(f"Error analyzing basic files for editing: {e}")
+            logger.error("Error analyzing basic files for editing: %s", e)
             raise ValueError(f"Failed to analyze basic filenames: {e}")
 
     def regex_match_basic(self, filename):
@@ -132,9 +168,45 @@ class FilenameAssembler:
         """
         return PATTERN_IDENTITY_FILENAME.match(filename)
 
-    def regex_match_datetime_filename(self, filename):
-        """Extract datetime from filename."""
-        return PATTERN_DATETIME_IN_FILENAME.match(filename)
+    def split_identity_fields(self, basename: str) -> Optional[tuple]:
+        """Split an Identity format basename into its fields without a regex.
+
+        Returns the same 14 fields as regex_match_identity(...).groups().
+        Only use this on names already validated against the Identity
+        pattern (e.g. when the files were dropped), since it does not check
+        the individual fields.
+
+        Args:
+            basename: Identity format filename without extension
+
+        Returns:
+            Tuple of 14 fields, or None if there are too few fields
+        """
+        parts = basename.split('_', 14)
+        if len(parts) < 15:
+            return None
+        original = parts[14]
+        # Strip the optional GPS suffix, as the pattern's trailing group does
+        if original.endswith('_N') or original.endswith('_G'):
+            original = original[:-2]
+        # parts[3] is the fixed 'B' separator, which is not a field
+        return (*parts[:3], *parts[4:14], original)
+
+    def regex_match_datetime_filename(self, filename: str) -> Optional[Tuple[str, str]]:
+        """Extract the date-time and original name from an Identity format filename.
+
+        Uses split_identity_fields(), so the name must already be validated.
+
+        Args:
+            filename: Identity format filename without extension
+
+        Returns:
+            Tuple of ('YYYY-MM-DD_HH-MM-SS', original name), or None if there are too few fields
+        """
+        fields = self.split_identity_fields(filename)
+        if fields is None:
+            return None
+        return f"{fields[9]}_{fields[10]}", fields[13]
 
     def assemble_basic_filename(self, original_filename: str, file_date: str, author_name: str,
                                 site_tuple: Tuple[str, str], activity: str, camera: str) -> Optional[str]:
@@ -151,14 +223,16 @@ class FilenameAssembler:
         Returns:
             Assembled filename, or None if already processed or missing required data
         """
-        # Check if already processed
-        if self.regex_match_basic(original_filename) or self.regex_match_identity(original_filename):
-            logger.info(f"File already processed: '{original_filename}'")
+        # Check if already processed (a plain camera name fails the cheap count)
+        underscores = original_filename.count('_')
+        if ((underscores >= MIN_UNDERSCORES_BASIC and self.regex_match_basic(original_filename))
+                or (underscores >= MIN_UNDERSCORES_IDENTITY and self.regex_match_identity(original_filename))):
+            logger.info("File already processed: '%s'", original_filename)
             return None
 
         # Validate inputs
         if not author_name or not site_tuple or len(site_tuple) != 2:
-            logger.warning(f"Invalid inputs for basic rename: author='{author_name}', site='{site_tuple}'")
+            logger.warning("Invalid inputs for basic rename: author='%s', site='%s'", author_name, site_tuple)
             return None
 
         area, site = site_tuple
@@ -173,14 +247,14 @@ class FilenameAssembler:
             if not file_date: missing.append('file_date')
             if not activity: missing.append('activity')
             if not camera: missing.append('camera')
-            logger.warning(f"Missing essential info for basic rename: {', '.join(missing)}")
+            logger.warning("Missing essential info for basic rename: %s", ', '.join(missing))
             return None
 
         # Sanitize original name by removing underscores
         sanitized_original = original_filename.replace('_', '')
 
         # Append _N to indicate no GPS data (will be replaced with _G when GPS is added)
-        return f"{author_code}_{site_string}_{file_date}_{activity}_{camera}_{sanitized_original}_N"
+        return "_".join((author_code, site_string, file_date, activity, camera, sanitized_original, "N"))
 
     def assemble_identity_filename(self, existing_filename: str, family: str, genus: str,
                                    species: str, confidence: str, phase: str, colour: str,
@@ -201,18 +275,19 @@ class FilenameAssembler:
             Assembled identity filename, or None if invalid or already processed
         """
         # Check if already has identity or if not basic format
-        if self.regex_match_identity(existing_filename):
-            logger.info(f"File already has identity: '{existing_filename}'")
+        underscores = existing_filename.count('_')
+        if underscores >= MIN_UNDERSCORES_IDENTITY and self.regex_match_identity(existing_filename):
+            logger.info("File already has identity: '%s'", existing_filename)
             return None
 
-        if not self.regex_match_basic(existing_filename):
-            logger.warning(f"File is not in basic format: '{existing_filename}'")
+        if underscores < MIN_UNDERSCORES_BASIC or not self.regex_match_basic(existing_filename):
+            logger.warning("File is not in basic format: '%s'", existing_filename)
             return None
 
         # Extract base name from basic filename
         base_name_match = PATTERN_BASIC_BASENAME.search(existing_filename)
         if not base_name_match:
-            logger.error(f"Failed to extract base name from: '{existing_filename}'")
+            logger.error("Failed to extract base name from: '%s'", existing_filename)
             return None
 
         base_name = base_name_match.group(1)
@@ -233,11 +308,11 @@ class FilenameAssembler:
             if not colour_code: missing.append('colour')
             if not behaviour_code: missing.append('behaviour')
             if not base_name: missing.append('base_name')
-            logger.warning(f"Missing essential info for identity rename: {', '.join(missing)}")
+            logger.warning("Missing essential info for identity rename: %s", ', '.join(missing))
             return None
 
         # Append _N to indicate no GPS data (will be replaced with _G when GPS is added)
-        return f"{family}_{genus}_{species}_B_{confidence}_{phase}_{colour_code}_{behaviour_code}_{base_name}_N"
+        return "_".join((family, genus, species, "B", confidence, phase, colour_code, behaviour_code, base_name, "N"))
     
     def assemble_edited_filename(self, family: str, genus: str, species: str, confidence: str, phase: str, colour: str, behaviour: str, author_code: str, site_string: str, date: str, time: str, activity: str, camera: str, filename: str, extension: str) -> str:
         """
@@ -279,10 +354,16 @@ class FilenameAssembler:
         if filename.endswith('_G') or filename.endswith('_N'):
             clean_filename = filename[:-2]
 
+        # Names with too few separators cannot match either pattern
+        underscores = clean_filename.count('_')
+        if underscores < MIN_UNDERSCORES_BASIC:
+            return None
+
         # Try Identity format first (more specific)
-        match = PATTERN_IDENTITY_FILENAME.match(clean_filename)
-        if match:
-            return match.group(9)  # Site string is group 9
+        if underscores >= MIN_UNDERSCORES_IDENTITY:
+            match = PATTERN_IDENTITY_FILENAME.match(clean_filename)
+            if match:
+                return match.group(9)  # Site string is group 9
 
         # Try Basic format
         match = PATTERN_BASIC_FILENAME.match(clean_filename)
@@ -292,7 +373,7 @@ class FilenameAssembler:
             if len(parts) >= 2:
                 potential_site = parts[1]
                 # Validate site string format: XXX-Name-XXX
-                if re.match(r'^[A-Z]{3}-[A-Za-z]+-[A-Z0-9]{3}$', potential_site):
+                if PATTERN_SITE_STRING.match(potential_site):
                     return potential_site
 
         return None
\ No newline at end of file
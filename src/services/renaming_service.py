@@ -74,7 +74,7 @@ class RenamingService:
                 else:
                     failures.append(os.path.basename(file_path))
             except Exception as e:
-                logger.error(f"Unexpected error renaming {file_path}: {e}")
+                logger.error("Unexpected error renaming %s: %s", file_path, e)
                 failures.append(os.path.basename(file_path))
 
         return RenamingResult(len(files), renamed_count, failures)
@@ -117,7 +117,7 @@ class RenamingService:
                 else:
                     failures.append(os.path.basename(file_path))
             except Exception as e:
-                logger.error(f"Unexpected error renaming {file_path}: {e}")
+                logger.error("Unexpected error renaming %s: %s", file_path, e)
                 failures.append(os.path.basename(file_path))
 
         return RenamingResult(len(files), renamed_count, failures)
@@ -150,20 +150,20 @@ class RenamingService:
             )
 
             if not new_filename_body:
-                logger.debug(f"Skipping {original_name}: already processed or missing data")
+                logger.debug("Skipping %s: already processed or missing data", original_name)
                 return False
 
             new_path = os.path.join(dir_name, new_filename_body + ext)
             if os.path.exists(new_path):
-                logger.warning(f"Target file already exists: {new_path}")
+                logger.warning("Target file already exists: %s", new_path)
                 return False
 
             os.rename(file_path, new_path)
-            logger.info(f"Renamed: {os.path.basename(file_path)} -> {new_filename_body + ext}")
+            logger.info("Renamed: %s -> %s", os.path.basename(file_path), new_filename_body + ext)
             return True
 
         except (OSError, IOError) as e:
-            logger.error(f"Error renaming {os.path.basename(file_path)}: {e}")
+            logger.error("Error renaming %s: %s", os.path.basename(file_path), e)
             return False
 
     def _rename_single_file_identity(
@@ -201,20 +201,20 @@ class RenamingService:
             )
 
             if not new_filename_body:
-                logger.debug(f"Skipping {original_name}: not in basic format or already has identity")
+                logger.debug("Skipping %s: not in basic format or already has identity", original_name)
                 return False
 
             new_path = os.path.join(dir_name, new_filename_body + ext)
             if os.path.exists(new_path):
-                logger.warning(f"Target file already exists: {new_path}")
+                logger.warning("Target file already exists: %s", new_path)
                 return False
 
             os.rename(file_path, new_path)
-            logger.info(f"Renamed: {os.path.basename(file_path)} -> {new_filename_body + ext}")
+            logger.info("Renamed: %s -> %s", os.path.basename(file_path), new_filename_body + ext)
             return True
 
         except (OSError, IOError) as e:
-            logger.error(f"Error renaming {os.path.basename(file_path)}: {e}")
+            logger.error("Error renaming %s: %s", os.path.basename(file_path), e)
             return False
 
     def validate_basic_inputs(
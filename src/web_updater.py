@@ -1,10 +1,10 @@
 # web_updater.py
-import requests
-import re
 import os
 from pathlib import Path
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
+from src.constants import PATTERN_FILE_DATE, PATTERN_REMOTE_FILE_LOCATION, PATTERN_DATA_FILE_PREFIX
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +19,37 @@ class WebUpdater:
     def __init__(self, data_path: Path):
         self.data_path = data_path
         self.access_token = ''
+        self._session = None
+
+    @property
+    def session(self):
+        """Pooled HTTP session, created on first use.
+
+        One session lets the token, list and download requests to HiDrive
+        reuse TCP/TLS connections. requests is imported here rather than at
+        module level, so app startup does not pay for it until an update runs.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.2),
+            )
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
 
     def connect(self, callback=None):
         """Connects to the HiDrive service and retrieves the access token."""
         if callback:
             callback("Connecting...")
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 self.TOKEN_URL,
                 data={'id': self.SHARE_ID},
                 timeout=15,
@@ -51,8 +75,10 @@ class WebUpdater:
 
     def fetch_file_list(self):
         """Fetches the list of available files from the server."""
+        import requests
+
         try:
-            response = requests.get(self.list_dir_url, timeout=15)
+            response = self.session.get(self.list_dir_url, timeout=15)
             response.raise_for_status()
             return [
                 member.get('name')
@@ -65,47 +91,83 @@ class WebUpdater:
         """Parses a file list to find unique location names."""
         locations = set()
         for file in file_list:
-            if file.startswith('Divesites_') or file.startswith('Species_'):
-                match = re.search(r'_(.+?)%20\d{4}-\d{2}-\d{2}', file)
+            if file.startswith(('Divesites_', 'Species_')) and '%20' in file:
+                match = PATTERN_REMOTE_FILE_LOCATION.search(file)
                 if match:
                     locations.add(match.group(1))
         return sorted(list(locations))
 
     def run_update(self, file_list, configs):
         """The main update logic, refactored from the original class."""
-        logger.debug(f"Running update with {len(file_list)} files")
-        logger.debug(f"Configs: {list(configs.keys())}")
+        logger.debug("Running update with %s files", len(file_list))
+        logger.debug("Configs: %s", list(configs.keys()))
+
+        # Bucket the remote files by their leading data type word in one pass
+        files_by_prefix = {prefix: [] for prefix in configs}
+        for f in file_list:
+            match = PATTERN_DATA_FILE_PREFIX.match(f)
+            bucket = files_by_prefix.get(match.group()) if match else None
+            if bucket is not None:
+                bucket.append(f.replace('%20', ' '))
+
+        # One listing of the data directory instead of an exists() per prefix
+        local_files = self._list_local_files()
 
         update_statuses = {}
         newest_files = {}
+        downloads = {}
         for prefix, config in configs.items():
-            logger.info(f"Processing {prefix}...")
-            logger.debug(f"Config for {prefix}: {config}")
-            prefix_files = [f.replace('%20', ' ') for f in file_list if f.startswith(prefix)]
-            logger.debug(f"Found {len(prefix_files)} files for prefix {prefix}")
+            logger.info("Processing %s...", prefix)
+            logger.debug("Config for %s: %s", prefix, config)
+            prefix_files = files_by_prefix[prefix]
+            logger.debug("Found %s files for prefix %s", len(prefix_files), prefix)
             newest_file = self._get_newest_file(prefix_files)
-            logger.info(f"Newest file for {prefix}: {newest_file}")
+            logger.info("Newest file for %s: %s", prefix, newest_file)
             if newest_file:
                 path_str = config['path_var']
                 old_filepath = Path(path_str) if path_str else None
-                should_update, reason = self._check_if_update_needed(config, newest_file, old_filepath)
-                logger.info(f"Update check for {prefix}: {should_update} ({reason})")
+                old_exists = old_filepath is not None and self._local_file_exists(old_filepath, local_files)
+                should_update, reason = self._check_if_update_needed(config, newest_file, old_filepath, old_exists)
+                logger.info("Update check for %s: %s (%s)", prefix, should_update, reason)
                 if should_update:
-                    status = self._perform_download(newest_file, newest_file, old_filepath)
-                    update_statuses[prefix] = status
+                    downloads[prefix] = (newest_file, newest_file, old_filepath)
                 else:
                     update_statuses[prefix] = reason
                 newest_files[prefix] = newest_file
+
+        # Downloads are latency bound, so fetch them all at once
+        if downloads:
+            with ThreadPoolExecutor(max_workers=len(downloads)) as executor:
+                futures = {
+                    prefix: executor.submit(self._perform_download, *args)
+                    for prefix, args in downloads.items()
+                }
+            for prefix, future in futures.items():
+                update_statuses[prefix] = future.result()
         return update_statuses, newest_files
 
+    def _list_local_files(self):
+        """Returns the set of file names currently in the data directory."""
+        try:
+            with os.scandir(self.data_path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError as e:
+            logger.warning("Could not list %s: %s", self.data_path, e)
+            return set()
+
+    def _local_file_exists(self, path, local_files):
+        """Checks a path against the data directory listing, falling back to a stat."""
+        if path.parent == self.data_path:
+            return path.name in local_files
+        return path.exists()
+
     def _get_newest_file(self, files):
         """Returns the file with the most recent date in its name."""
         newest_file = None
         newest_date = None
-        date_pattern = re.compile(r'(\d{4}-\d{2}-\d{2})')
 
         for file in files:
-            match = date_pattern.search(file)
+            match = PATTERN_FILE_DATE.search(file)
             if match:
                 file_date = match.group(1)
                 if not newest_date or file_date > newest_date:
@@ -116,30 +178,30 @@ class WebUpdater:
 
         return newest_file
 
-    def _check_if_update_needed(self, config, cleaned_file_name, old_filepath):
+    def _check_if_update_needed(self, config, cleaned_file_name, old_filepath, old_exists):
         """Check if a file needs to be updated."""
-        logger.debug(f"Checking if update is needed for {old_filepath}")
+        logger.debug("Checking if update is needed for %s", old_filepath)
 
         if not config['requires_date_check']:
-            logger.debug(f"Skipping date check for {cleaned_file_name}")
+            logger.debug("Skipping date check for %s", cleaned_file_name)
             return True, "Update required"
 
-        new_date_match = re.search(r'(\d{4}-\d{2}-\d{2})', cleaned_file_name)
+        new_date_match = PATTERN_FILE_DATE.search(cleaned_file_name)
         if not new_date_match:
-            logger.warning(f"Malformed remote filename: {cleaned_file_name}")
+            logger.warning("Malformed remote filename: %s", cleaned_file_name)
             return False, "Malformed remote filename"
         new_date_str = new_date_match.group(1)
 
-        if not old_filepath or not old_filepath.exists():
-            logger.info(f"No local file found for {cleaned_file_name}")
+        if not old_filepath or not old_exists:
+            logger.info("No local file found for %s", cleaned_file_name)
             return True, "No local file"
 
-        local_date_match = re.search(r'(\d{4}-\d{2}-\d{2})', old_filepath.name)
+        local_date_match = PATTERN_FILE_DATE.search(old_filepath.name)
         if not local_date_match:
-            logger.warning(f"Malformed local file: {old_filepath.name}")
+            logger.warning("Malformed local file: %s", old_filepath.name)
             return True, "Malformed local file"
 
-        logger.debug(f"Comparing dates: {new_date_str} vs {local_date_match.group(1)}")
+        logger.debug("Comparing dates: %s vs %s", new_date_str, local_date_match.group(1))
         if new_date_str > local_date_match.group(1):
             logger.info("Remote file is newer.")
             return True, "Remote is newer"
@@ -147,16 +209,26 @@ class WebUpdater:
         return False, "up-to-date"
 
     def _perform_download(self, remote_file, cleaned_filename, old_filepath):
+        import requests
+
         new_filepath = self.data_path / cleaned_filename
+        # Download next to the target and swap it in once complete, so a failed
+        # transfer never leaves a truncated data file where the app loads it
+        part_filepath = new_filepath.with_name(new_filepath.name + '.part')
         url = self.get_download_url(remote_file)
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            with open(new_filepath, 'wb') as f:
-                f.write(response.content)
+            # Stream to disk in chunks rather than holding the whole file in memory
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                with open(part_filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+            os.replace(part_filepath, new_filepath)
 
             if old_filepath and old_filepath.exists() and old_filepath != new_filepath:
                 os.remove(old_filepath)
             return "updated"
         except requests.exceptions.RequestException:
+            if part_filepath.exists():
+                os.remove(part_filepath)
             return "Error"
@@ -124,6 +124,8 @@ class ExifPreviewDialog(tk.Toplevel):
         self.tree.tag_configure('ok', foreground='#2e7d32')
         self.tree.tag_configure('link', foreground='#1976d2')
 
+        # Keep the displayed values so auto-fit needn't read them back from Tk
+        self._row_values = []
         for mapping in self.file_mappings:
             filename = mapping.get('filename', '')
             new_filename = mapping.get('new_filename', '')
@@ -134,17 +136,17 @@ class ExifPreviewDialog(tk.Toplevel):
 
             if error:
                 # Error row - show original filename
-                self.tree.insert('', 'end',
-                    values=(filename, error, '-', '-', '-'),
-                    tags=('error',))
+                row = (filename, error, '-', '-', '-')
+                self._row_values.append(row)
+                self.tree.insert('', 'end', values=row, tags=('error',))
             else:
                 # Valid row with coordinates - show new filename
                 filename_display = new_filename if new_filename else filename
                 lat_str = f"{lat:.6f}" if lat is not None else '-'
                 lon_str = f"{lon:.6f}" if lon is not None else '-'
-                self.tree.insert('', 'end',
-                    values=(filename_display, site_name, lat_str, lon_str, 'Open'),
-                    tags=('ok',))
+                row = (filename_display, site_name, lat_str, lon_str, 'Open')
+                self._row_values.append(row)
+                self.tree.insert('', 'end', values=row, tags=('ok',))
 
     def _on_tree_click(self, event):
         """Handle click on treeview - check if Maps link was clicked."""
@@ -183,7 +185,7 @@ class ExifPreviewDialog(tk.Toplevel):
 
     def _open_maps(self, lat, lon):
         """Open Google Maps at the specified coordinates."""
-        webbrowser.open(f"https://maps.google.com/?q={lat},{lon}")
+        webbrowser.open(f"https://maps.google.com/?q={lat},{lon}", new=2)
 
     def _auto_fit_columns(self):
         """Auto-fit column widths based on content."""
@@ -200,22 +202,12 @@ class ExifPreviewDialog(tk.Toplevel):
             'maps': 'Maps'
         }
 
-        # Calculate max width for each column
+        # Measure each distinct cell text once per column
         col_widths = {}
-        for col in ('filename', 'divesite', 'latitude', 'longitude', 'maps'):
-            # Start with header width
-            max_width = tree_font.measure(headers[col]) + padding
-
-            # Check all rows
-            for item in self.tree.get_children():
-                values = self.tree.item(item, 'values')
-                col_idx = {'filename': 0, 'divesite': 1,
-                          'latitude': 2, 'longitude': 3, 'maps': 4}[col]
-                text = str(values[col_idx]) if col_idx < len(values) else ''
-                text_width = tree_font.measure(text) + padding
-                max_width = max(max_width, text_width)
-
-            col_widths[col] = max_width
+        for col_idx, col in enumerate(('filename', 'divesite', 'latitude', 'longitude', 'maps')):
+            texts = {str(row[col_idx]) for row in self._row_values}
+            texts.add(headers[col])
+            col_widths[col] = max(tree_font.measure(text) for text in texts) + padding
 
         # Apply calculated widths
         for col, width in col_widths.items():
@@ -4,7 +4,10 @@ from tkinter import ttk, font as tkFont
 from tkinterdnd2 import DND_FILES, TkinterDnD
 import os
 import logging
-from PIL import Image, ImageTk
+import threading
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from tktooltip import ToolTip
 
 # Import refactored components
@@ -24,11 +27,20 @@ from src.constants import (
     DEFAULT_SITE_TEXT,
     DEFAULT_ACTIVITY_TEXT,
     SEARCH_PLACEHOLDER,
-    IMAGE_FILE_EXTENSIONS
+    TREE_FILL_CHUNK,
+    IMAGE_FILE_EXTENSIONS,
+    IDENTITY_FIELD_NAMES,
+    MODE_HINTS
 )
 
 logger = logging.getLogger(__name__)
 
+# Visibility of the 11 editable fields (7 taxonomy/attribute, then author,
+# site, activity, camera) in each mode
+_FIELDS_BASIC = (False,) * 7 + (True,) * 4
+_FIELDS_IDENTIFY = (True,) * 7 + (False,) * 4
+_FIELDS_NONE = (False,) * 11
+
 class MainWindow(TkinterDnD.Tk):
     """The main application window, focused on UI management."""
 
@@ -44,6 +56,11 @@ class MainWindow(TkinterDnD.Tk):
         self.exiftool = ExifToolHandler()
         self.web_updater = WebUpdater(app_utils.get_data_path())
 
+        # Read the data files while the widgets are built; applied below on this thread
+        prefetch = ThreadPoolExecutor(max_workers=1)
+        data_files = prefetch.submit(self.data.read_data_files)
+        prefetch.shutdown(wait=False)
+
         # Undo history for rename operations
         self.rename_history = []  # List of (old_path, new_path) tuples
 
@@ -52,14 +69,27 @@ class MainWindow(TkinterDnD.Tk):
 
         # Edit mode tracking
         self.editing_files = []
+        self.editing_info = {}
         self.editing_format = None  # 'basic' or 'identity'
         self.fields_to_edit = None
 
         # Processing state flag (prevents re-entrancy during batch operations)
         self._processing = False
 
+        # Drop handler for each mode, resolved once instead of per drop
+        self._mode_handlers = {
+            "Edit": self._handle_edit_mode,
+            "Basic": self._handle_basic_mode,
+            "Identify": self._handle_identify_mode,
+            "Meta": self._handle_exif_mode
+        }
+
         # --- UI Setup ---
         self.tree_columns = TREE_COLUMNS
+        self._tree_items = None  # List currently shown in the tree (see fill_tree)
+        self._tree_fill_after_id = None
+        self._selected_item = None  # Last row applied by _row_selected
+        self._selected_values = None
         self._setup_widgets()
 
         # Set fixed width (height can still change with modes)
@@ -68,7 +98,10 @@ class MainWindow(TkinterDnD.Tk):
         self.minsize(800, 0)
         self.maxsize(800, 2000)
 
-        self.on_data_updated() # Initial data load and UI population
+        self.on_data_updated(data_files.result()) # Initial data load and UI population
+
+        # Flush any debounced preference save before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _setup_widgets(self):
         """Master method to build the entire UI by calling sub-methods."""
@@ -84,6 +117,7 @@ class MainWindow(TkinterDnD.Tk):
         self._setup_edit_frame()
         self._setup_attribute_comboboxes()
         self._setup_info_comboboxes()
+        self._setup_edit_field_table()
         self._setup_maps_link() # Assuming _open_googlemaps is also implemented
         self._setup_status_text()
         self._build_tree_headers()
@@ -95,8 +129,8 @@ class MainWindow(TkinterDnD.Tk):
         """Set application icon."""
         try:
             icon_path = app_utils.get_app_path().parent / 'config' / 'icon.png'
-            ico = Image.open(icon_path)
-            photo = ImageTk.PhotoImage(ico)
+            # Tk reads PNG natively, so Pillow isn't needed at startup
+            photo = tk.PhotoImage(file=str(icon_path))
             self.wm_iconphoto(False, photo)
         except Exception as e:
             # Icon loading is non-critical, just log and continue
@@ -119,13 +153,7 @@ class MainWindow(TkinterDnD.Tk):
         """Reset window background when files are dragged away."""
         self.config(bg=self._default_bg)
         # Restore mode hint
-        mode_hints = {
-            'Basic': "Drop files to add photographer, site, and activity info",
-            'Identify': "Search or select a species, then drop files to identify",
-            'Edit': "Drop files to batch edit their metadata",
-            'Meta': "Drop Basic/Identify format files to auto-extract GPS from filename"
-        }
-        self._notice(mode_hints[self.mode.get()])
+        self._notice(MODE_HINTS[self.mode.get()])
 
     def _configure_main_container_grid(self, container):
         container.grid_columnconfigure(0, weight=1)
@@ -327,6 +355,7 @@ class MainWindow(TkinterDnD.Tk):
         self.search_field.bind("<Return>", self.search)
         self.search_field.bind("<KeyRelease>", self._on_search_key_release)
         self._search_after_id = None
+        self._config_save_after_id = None
 
     def _on_search_focus_in(self, event):
         """Clear placeholder text when search field gains focus."""
@@ -371,9 +400,10 @@ class MainWindow(TkinterDnD.Tk):
         self.tree.bind("<ButtonRelease-1>", self._row_selected)
 
     def _build_tree_headers(self):
+        header_font = tkFont.Font()
         for col in self.tree_columns:
             self.tree.heading(col, text=col.title(), command=lambda c=col: self.sortby(self.tree, c, False))
-            self.tree.column(col, width=tkFont.Font().measure(col.title()), anchor='w')
+            self.tree.column(col, width=header_font.measure(col.title()), anchor='w')
 
     def _setup_tooltips(self):
         """Add tooltips to UI elements for better usability."""
@@ -432,8 +462,11 @@ class MainWindow(TkinterDnD.Tk):
         self._setup_combobox_group(self.bottom_frame, configs)
 
     def _open_googlemaps(self, event):
-        coordinates = self.data.get_lat_long_from_site(self.cb_site.get())
-        os.system(f"start https://maps.google.com/?q={coordinates[0]},{coordinates[1]}")
+        lat, lon = self.data.get_lat_long_from_site(self.cb_site.get())
+        if lat is None or lon is None:
+            return
+        # Non-blocking, cross-platform; no cmd.exe spawn or shell parsing
+        webbrowser.open(f"https://maps.google.com/?q={lat},{lon}", new=2)
 
     def _setup_maps_link(self):
         self.link = tk.Label(self.bottom_frame, text="Google Maps", fg="blue", cursor="hand2")
@@ -524,6 +557,9 @@ class MainWindow(TkinterDnD.Tk):
         """Update the ExifTool status display and check for updates."""
         import sys
 
+        # Invalidate any update check still running for a previous refresh
+        self._exiftool_check_id = getattr(self, '_exiftool_check_id', 0) + 1
+
         # Hide progress bar and clear download status
         self.exiftool_progress.grid_remove()
         self.exiftool_progress['value'] = 0
@@ -539,20 +575,13 @@ class MainWindow(TkinterDnD.Tk):
             self.exiftool_status_label.config(text="Installed", foreground='green')
             self.exiftool_version_label.config(text=version or "unknown")
 
-            # Check for updates
-            try:
-                latest = self.exiftool.fetch_latest_version()
-                if latest and version:
-                    installed = tuple(int(x) for x in version.split('.'))
-                    available = tuple(int(x) for x in latest.split('.'))
-                    if available > installed:
-                        self.exiftool_version_label.config(
-                            text=f"{version} (update available: {latest})"
-                        )
-                        if sys.platform in ("win32", "darwin"):
-                            self.btn_update_exiftool.pack(side='left', padx=(0, 5))
-            except Exception:
-                pass  # Version check is best-effort
+            # Check for updates in the background; the page fetch can take seconds
+            if version:
+                threading.Thread(
+                    target=self._fetch_exiftool_latest,
+                    args=(self._exiftool_check_id, version),
+                    daemon=True
+                ).start()
         else:
             self.exiftool_status_label.config(text="Not installed", foreground='red')
             self.exiftool_version_label.config(text="Required to write GPS coordinates")
@@ -561,11 +590,45 @@ class MainWindow(TkinterDnD.Tk):
                 self.btn_install_exiftool.pack(side='left', padx=(0, 5))
             self.btn_open_website.pack(side='left', padx=(0, 5))
 
+    def _fetch_exiftool_latest(self, check_id, version):
+        """Fetch the latest ExifTool version (runs in a background thread).
+
+        Args:
+            check_id: Status refresh this check belongs to
+            version: Installed ExifTool version
+        """
+        latest = self.exiftool.fetch_latest_version()
+        if latest:
+            self.after(0, lambda: self._show_exiftool_update(check_id, version, latest))
+
+    def _show_exiftool_update(self, check_id, version, latest):
+        """Show an available ExifTool update (runs on the main thread).
+
+        Args:
+            check_id: Status refresh the result belongs to
+            version: Installed ExifTool version
+            latest: Latest version available on exiftool.org
+        """
+        import sys
+
+        # A newer refresh has reset the status display in the meantime
+        if check_id != self._exiftool_check_id:
+            return
+        try:
+            installed = tuple(int(x) for x in version.split('.'))
+            available = tuple(int(x) for x in latest.split('.'))
+            if available > installed:
+                self.exiftool_version_label.config(
+                    text=f"{version} (update available: {latest})"
+                )
+                if sys.platform in ("win32", "darwin"):
+                    self.btn_update_exiftool.pack(side='left', padx=(0, 5))
+        except Exception:
+            pass  # Version check is best-effort
+
     def _install_exiftool(self):
         """Attempt to download and install ExifTool."""
         import sys
-        import webbrowser
-        from src.exiftool_handler import ExifToolHandler
 
         if sys.platform == "darwin":
             # On macOS, open the browser to download the .pkg installer
@@ -606,20 +669,22 @@ class MainWindow(TkinterDnD.Tk):
 
     def _open_exiftool_website(self):
         """Open the ExifTool website in the default browser."""
-        import webbrowser
         webbrowser.open(self.exiftool.get_website_url())
 
     def _setup_status_text(self):
         """Status is now handled by status_label in the status bar below tabs."""
         pass  # Status bar is created in _setup_mode_tabs
 
-    def on_data_updated(self):
+    def on_data_updated(self, files=None):
         """Reload all data files and refresh the UI.
 
         Called after updating data files from the web or when explicitly requested.
         Reloads CSV/JSON data files, updates all comboboxes, and saves config.
+
+        Args:
+            files: Already read data files from DataManager.read_data_files(), if any
         """
-        self.data.load_all_data()
+        self.data.load_all_data(files)
         self.update_all_comboboxes()
         self.config_manager.save()
         # Show mode hint after data is loaded
@@ -709,14 +774,7 @@ class MainWindow(TkinterDnD.Tk):
         files = self.splitlist(event.data)
         mode = self.mode.get()
 
-        mode_handlers = {
-            "Edit": self._handle_edit_mode,
-            "Basic": self._handle_basic_mode,
-            "Identify": self._handle_identify_mode,
-            "Meta": self._handle_exif_mode
-        }
-
-        handler = mode_handlers.get(mode)
+        handler = self._mode_handlers.get(mode)
         if handler:
             self.after(0, lambda h=handler, f=files: h(f))
         else:
@@ -738,16 +796,18 @@ class MainWindow(TkinterDnD.Tk):
         # Detect file format (Basic or Identity)
         first_basename = basenames[0]
         is_identity_format = self.assembler.regex_match_identity(first_basename) is not None
-        is_basic_format = self.assembler.regex_match_basic(first_basename) is not None
+        is_basic_format = not is_identity_format and self.assembler.regex_match_basic(first_basename) is not None
 
         try:
             if is_identity_format:
                 # Use Identity format analysis
-                is_same, values = self.assembler.analyze_files_for_editing(basenames)
+                parsed_info = self.assembler.parse_identity_files(basenames)
+                is_same, values = self.assembler.analyze_files_for_editing(basenames, parsed_info)
                 self.editing_format = 'identity'
             elif is_basic_format:
                 # Use Basic format analysis
-                is_same, values = self.assembler.analyze_basic_files_for_editing(basenames)
+                parsed_info = self.assembler.parse_basic_files(basenames)
+                is_same, values = self.assembler.analyze_basic_files_for_editing(basenames, parsed_info)
                 self.editing_format = 'basic'
             else:
                 self._warn("Files are not in Basic or Identity format.")
@@ -758,6 +818,8 @@ class MainWindow(TkinterDnD.Tk):
 
         self.fields_to_edit = is_same  # Store the flags for the rename operation
         self.editing_files = files
+        # Parsed fields per file, reused by the rename preview
+        self.editing_info = dict(zip(files, parsed_info))
 
         if not any(is_same):
             self._warn("Files have no common editable information.")
@@ -781,8 +843,8 @@ class MainWindow(TkinterDnD.Tk):
             if camera_full_name:
                 ui_values[10] = camera_full_name
 
-        self._toggle_checkboxes(*ui_flags)
-        self._set_checkboxes(*ui_values)
+        self._toggle_checkboxes(ui_flags)
+        self._set_checkboxes(ui_values)
 
         format_name = "Identity" if self.editing_format == 'identity' else "Basic"
         self._notice(f"Loaded {len(files)} {format_name} format files for editing. Make changes and click 'Rename'.")
@@ -845,20 +907,10 @@ class MainWindow(TkinterDnD.Tk):
                 self._notice("No valid files to rename")
                 return
 
-        # Clear history for new rename batch
-        self.rename_history.clear()
-
-        renamed_count = 0
-        total = len(to_rename)
-        self._show_progress(total, f"Renaming 0/{total}...")
-
-        for i, mapping in enumerate(to_rename):
-            if self._rename_single_file_basic(mapping['path'], author, site_tuple, activity, camera_abbrev):
-                renamed_count += 1
-            self._update_progress(i + 1, f"Renaming {i + 1}/{total}...")
-
-        self._hide_progress()
-        self._notice(f"{renamed_count}/{len(to_rename)} files renamed.")
+        # Reuse the names computed for the preview rather than reading EXIF again
+        self._run_rename_batch(
+            to_rename, lambda renamed, total: self._notice(f"{renamed}/{total} files renamed.")
+        )
 
     def _generate_previews_basic(self, files, author, site_tuple, activity, camera_abbrev):
         """Generate preview data for basic mode renames.
@@ -911,29 +963,32 @@ class MainWindow(TkinterDnD.Tk):
                 previews.append(preview)
             return previews
 
-        # Fallback to PIL for single files or when ExifTool unavailable
+        # Fallback to PIL for single files or when ExifTool unavailable.
+        # Dates are read on a small thread pool so the file reads overlap;
+        # results come back in order and the UI is only touched here.
         previews = []
-        for i, file_path in enumerate(files):
-            # Update status bar with progress and keep UI responsive
-            self._notice(f"Processing {i + 1} of {total} files...")
-            self.update_idletasks()
+        with ThreadPoolExecutor(max_workers=max(1, min(8, total))) as executor:
+            file_dates = executor.map(self.exif.get_creation_date_str, files)
+            for i, (file_path, file_date) in enumerate(zip(files, file_dates)):
+                # Update status bar with progress and keep UI responsive
+                self._notice(f"Processing {i + 1} of {total} files...")
+                self.update_idletasks()
 
-            original = os.path.basename(file_path)
-            name, ext = os.path.splitext(original)
+                original = os.path.basename(file_path)
+                name, ext = os.path.splitext(original)
 
-            preview = {'path': file_path, 'original': original, 'new': None, 'error': None}
+                preview = {'path': file_path, 'original': original, 'new': None, 'error': None}
 
-            file_date = self.exif.get_creation_date_str(file_path)
-            if not file_date:
-                preview['error'] = 'No EXIF date'
-            else:
-                new_name = self.assembler.assemble_basic_filename(name, file_date, author, site_tuple, activity, camera_abbrev)
-                if new_name:
-                    preview['new'] = new_name + ext
+                if not file_date:
+                    preview['error'] = 'No EXIF date'
                 else:
-                    preview['error'] = 'Already processed'
+                    new_name = self.assembler.assemble_basic_filename(name, file_date, author, site_tuple, activity, camera_abbrev)
+                    if new_name:
+                        preview['new'] = new_name + ext
+                    else:
+                        preview['error'] = 'Already processed'
 
-            previews.append(preview)
+                previews.append(preview)
         return previews
 
     def _handle_identify_mode(self, files):
@@ -981,23 +1036,11 @@ class MainWindow(TkinterDnD.Tk):
                 self._notice("No valid files to rename")
                 return
 
-        # Clear history for new rename batch
-        self.rename_history.clear()
-
-        renamed_count = 0
-        total = len(to_rename)
-        self._show_progress(total, f"Renaming 0/{total}...")
-
-        for i, mapping in enumerate(to_rename):
-            if self._rename_single_file_identity(
-                mapping['path'], family, genus, species, confidence, phase, colour, behaviour
-            ):
-                renamed_count += 1
-            self._update_progress(i + 1, f"Renaming {i + 1}/{total}...")
+        def on_done(renamed, total):
+            self._notice(f"{renamed}/{total} files renamed.")
+            self._reset_info()
 
-        self._hide_progress()
-        self._notice(f"{renamed_count}/{len(to_rename)} files renamed.")
-        self._reset_info()
+        self._run_rename_batch(to_rename, on_done)
 
     def _generate_previews_identify(self, files, family, genus, species,
                                      confidence, phase, colour, behaviour):
@@ -1079,6 +1122,7 @@ class MainWindow(TkinterDnD.Tk):
         total = len(to_process)
         self._show_progress(total, f"Writing GPS 0/{total}...")
 
+        existing = app_utils.snapshot_directory_names(m['path'] for m in to_process)
         for i, mapping in enumerate(to_process):
             # Write GPS coordinates
             success, _ = self.exiftool.write_gps_coordinates(
@@ -1096,18 +1140,19 @@ class MainWindow(TkinterDnD.Tk):
                     new_path = os.path.join(dir_name, new_filename)
 
                     # Check if target already exists
-                    if not os.path.exists(new_path):
+                    if not app_utils.path_taken(existing, new_path):
                         try:
                             os.rename(mapping['path'], new_path)
+                            app_utils.record_rename(existing, mapping['path'], new_path)
                             rename_count += 1
-                            logger.debug(f"Renamed: {current_filename} -> {new_filename}")
+                            logger.debug("Renamed: %s -> %s", current_filename, new_filename)
                         except OSError as e:
-                            logger.warning(f"Failed to rename {current_filename}: {e}")
+                            logger.warning("Failed to rename %s: %s", current_filename, e)
                     else:
-                        logger.warning(f"Cannot rename to {new_filename}: file already exists")
+                        logger.warning("Cannot rename to %s: file already exists", new_filename)
                 elif new_filename == current_filename:
                     # Filename unchanged (GPS marker already present)
-                    logger.debug(f"Skipped rename for {current_filename}: GPS marker already present")
+                    logger.debug("Skipped rename for %s: GPS marker already present", current_filename)
                     rename_count += 1  # Count as successful since no rename needed
 
             self._update_progress(i + 1, f"Writing GPS {i + 1}/{total}...")
@@ -1170,6 +1215,7 @@ class MainWindow(TkinterDnD.Tk):
             List of dicts with keys: path, filename, site_string, site_name, lat, lon, new_filename, error
         """
         previews = []
+        existing = app_utils.snapshot_directory_names(files)
         for file_path in files:
             filename = os.path.basename(file_path)
             name, ext = os.path.splitext(filename)
@@ -1186,7 +1232,7 @@ class MainWindow(TkinterDnD.Tk):
             }
 
             # Check if file exists and is an image
-            if not os.path.exists(file_path):
+            if not app_utils.path_taken(existing, file_path):
                 preview['error'] = 'File not found'
                 previews.append(preview)
                 continue
@@ -1237,46 +1283,55 @@ class MainWindow(TkinterDnD.Tk):
 
         return previews
 
-    def _rename_single_file_basic(self, file_path, author, site_tuple, activity, camera_abbrev):
-        """Rename a single file with basic metadata.
+    def _rename_with_backup(self, file_path, new_filename, existing=None, lock=None):
+        """Rename a file within its directory, keeping a backup until the rename succeeds.
+
+        Args:
+            file_path: Path of the file to rename
+            new_filename: New filename (with extension) from the preview
+            existing: Directory snapshot from app_utils.snapshot_directory_names()
+            lock: Lock shared by concurrent renames of one batch; the backup copy
+                runs outside it, the collision check and rename inside it
 
         Returns:
             bool: True if file was renamed successfully, False otherwise
-        """
-        try:
-            from pathlib import Path
-            from src.app_utils import validate_safe_path
-            import shutil
 
-            dir_name = os.path.dirname(file_path)
-            original_name, ext = os.path.splitext(os.path.basename(file_path))
+        Raises:
+            OSError: If the backup or rename fails (the backup is restored first)
+        """
+        if not new_filename:
+            return False
 
-            file_date = self.exif.get_creation_date_str(file_path)
-            new_filename_body = self.assembler.assemble_basic_filename(
-                original_name, file_date, author, site_tuple, activity, camera_abbrev
-            )
+        from pathlib import Path
+        from src.app_utils import validate_safe_path
+        import shutil
 
-            if not new_filename_body:
-                return False
+        dir_name = os.path.dirname(file_path)
+        new_path = os.path.join(dir_name, new_filename)
 
-            new_path = os.path.join(dir_name, new_filename_body + ext)
+        # Validate that new path is in the same directory (prevent path traversal)
+        if not validate_safe_path(Path(dir_name), Path(new_filename)):
+            logger.warning("Rejecting unsafe rename path: %s", new_filename)
+            return False
 
-            # Validate that new path is in the same directory (prevent path traversal)
-            if not validate_safe_path(Path(dir_name), Path(new_filename_body + ext)):
-                logger.warning(f"Rejecting unsafe rename path: {new_filename_body + ext}")
-                return False
+        if app_utils.path_taken(existing, new_path):
+            return False
 
-            if os.path.exists(new_path):
-                return False
+        # Create backup before renaming
+        backup_path = f"{file_path}.backup"
+        try:
+            # Copy file to backup
+            shutil.copy2(file_path, backup_path)
 
-            # Create backup before renaming
-            backup_path = f"{file_path}.backup"
-            try:
-                # Copy file to backup
-                shutil.copy2(file_path, backup_path)
+            with lock or nullcontext():
+                # Another file in the batch may have taken the name meanwhile
+                if app_utils.path_taken(existing, new_path):
+                    os.remove(backup_path)
+                    return False
 
                 # Attempt rename
                 os.rename(file_path, new_path)
+                app_utils.record_rename(existing, file_path, new_path)
 
                 # Remove backup on success
                 os.remove(backup_path)
@@ -1284,84 +1339,69 @@ class MainWindow(TkinterDnD.Tk):
                 # Record for undo
                 self.rename_history.append((file_path, new_path))
 
-                logger.debug(f"Successfully renamed: {os.path.basename(file_path)} -> {os.path.basename(new_path)}")
-                return True
-            except Exception as e:
-                # Restore from backup if rename failed
-                if os.path.exists(backup_path):
-                    if not os.path.exists(file_path):
-                        shutil.move(backup_path, file_path)
-                        logger.info(f"Restored from backup: {os.path.basename(file_path)}")
-                    else:
-                        os.remove(backup_path)
-                logger.error(f"Rename failed, restored backup: {e}")
-                raise
-        except (OSError, IOError) as e:
-            self._warn(f"Error renaming {os.path.basename(file_path)}: {e}")
-            return False
-
-    def _rename_single_file_identity(self, file_path, family, genus, species,
-                                     confidence, phase, colour, behaviour):
-        """Rename a single file with identity metadata.
-
-        Returns:
-            bool: True if file was renamed successfully, False otherwise
-        """
-        try:
-            from pathlib import Path
-            from src.app_utils import validate_safe_path
-            import shutil
-
-            dir_name = os.path.dirname(file_path)
-            original_name, ext = os.path.splitext(os.path.basename(file_path))
-
-            new_filename_body = self.assembler.assemble_identity_filename(
-                original_name, family, genus, species, confidence, phase, colour, behaviour
-            )
+            logger.debug("Successfully renamed: %s -> %s", os.path.basename(file_path), new_filename)
+            return True
+        except Exception as e:
+            # Restore from backup if rename failed
+            if os.path.exists(backup_path):
+                if not os.path.exists(file_path):
+                    shutil.move(backup_path, file_path)
+                    logger.info("Restored from backup: %s", os.path.basename(file_path))
+                else:
+                    os.remove(backup_path)
+            logger.error("Rename failed, restored backup: %s", e)
+            raise
 
-            if not new_filename_body:
-                return False
+    def _run_rename_batch(self, to_rename, on_done):
+        """Rename previewed files on a worker thread while the UI stays responsive.
 
-            new_path = os.path.join(dir_name, new_filename_body + ext)
+        The file operations run off the Tk thread; progress is polled with
+        after() and on_done is called back on the Tk thread once all files
+        have been handled.
 
-            # Validate that new path is in the same directory (prevent path traversal)
-            if not validate_safe_path(Path(dir_name), Path(new_filename_body + ext)):
-                logger.warning(f"Rejecting unsafe rename path: {new_filename_body + ext}")
-                return False
+        Args:
+            to_rename: Preview mappings with 'path' and 'new' keys
+            on_done: Callable taking (renamed_count, total)
+        """
+        # Clear history for new rename batch
+        self.rename_history.clear()
 
-            if os.path.exists(new_path):
-                return False
+        total = len(to_rename)
+        self._show_progress(total, f"Renaming 0/{total}...")
+        state = {'done': 0, 'renamed': 0}
 
-            # Create backup before renaming
-            backup_path = f"{file_path}.backup"
+        def rename_one(mapping, existing, lock):
             try:
-                # Copy file to backup
-                shutil.copy2(file_path, backup_path)
-
-                # Attempt rename
-                os.rename(file_path, new_path)
-
-                # Remove backup on success
-                os.remove(backup_path)
+                return self._rename_with_backup(mapping['path'], mapping['new'], existing, lock)
+            except OSError as e:
+                logger.warning("Error renaming %s: %s", os.path.basename(mapping['path']), e)
+                return False
 
-                # Record for undo
-                self.rename_history.append((file_path, new_path))
+        def work():
+            existing = app_utils.snapshot_directory_names(m['path'] for m in to_rename)
+            lock = threading.Lock()
+            # Backup copies dominate and overlap well; renames are serialized by the lock
+            with ThreadPoolExecutor(max_workers=max(1, min(4, total))) as executor:
+                futures = [executor.submit(rename_one, m, existing, lock) for m in to_rename]
+                for future in futures:
+                    if future.result():
+                        state['renamed'] += 1
+                    state['done'] += 1
+
+        worker = threading.Thread(target=work, daemon=True)
+        worker.start()
+
+        def poll():
+            done = state['done']
+            self.progress_bar['value'] = done
+            self.progress_label.config(text=f"Renaming {done}/{total}...")
+            if worker.is_alive():
+                self.after(50, poll)
+                return
+            self._hide_progress()
+            on_done(state['renamed'], total)
 
-                logger.debug(f"Successfully renamed: {os.path.basename(file_path)} -> {os.path.basename(new_path)}")
-                return True
-            except Exception as e:
-                # Restore from backup if rename failed
-                if os.path.exists(backup_path):
-                    if not os.path.exists(file_path):
-                        shutil.move(backup_path, file_path)
-                        logger.info(f"Restored from backup: {os.path.basename(file_path)}")
-                    else:
-                        os.remove(backup_path)
-                logger.error(f"Rename failed, restored backup: {e}")
-                raise
-        except (OSError, IOError) as e:
-            self._warn(f"Error renaming {os.path.basename(file_path)}: {e}")
-            return False
+        self.after(50, poll)
 
     def _notice(self, text):
         """Display an informational message in the status bar.
@@ -1501,14 +1541,17 @@ class MainWindow(TkinterDnD.Tk):
             return
 
         undone = 0
+        existing = app_utils.snapshot_directory_names(
+            path for pair in self.rename_history for path in pair)
         for old_path, new_path in reversed(self.rename_history):
-            if os.path.exists(new_path) and not os.path.exists(old_path):
+            if app_utils.path_taken(existing, new_path) and not app_utils.path_taken(existing, old_path):
                 try:
                     os.rename(new_path, old_path)
+                    app_utils.record_rename(existing, new_path, old_path)
                     undone += 1
-                    logger.debug(f"Undone: {os.path.basename(new_path)} -> {os.path.basename(old_path)}")
+                    logger.debug("Undone: %s -> %s", os.path.basename(new_path), os.path.basename(old_path))
                 except OSError as e:
-                    logger.warning(f"Failed to undo rename: {e}")
+                    logger.warning("Failed to undo rename: %s", e)
 
         self.rename_history.clear()
         self._notice(f"Undone {undone} rename(s)")
@@ -1525,11 +1568,27 @@ class MainWindow(TkinterDnD.Tk):
         """
         if self.mode.get() != 'Basic':
             return
-        self.config_manager.set_user_pref('author', self.cb_author.get())
-        self.config_manager.set_user_pref('activity', self.cb_activity.get())
-        self.config_manager.set_user_pref('camera', self.cb_camera.get())
+        self.config_manager.set_user_pref('author', self.cb_author.get(), save=False)
+        self.config_manager.set_user_pref('activity', self.cb_activity.get(), save=False)
+        self.config_manager.set_user_pref('camera', self.cb_camera.get(), save=False)
+
+        # Coalesce rapid combobox changes into a single write
+        if self._config_save_after_id:
+            self.after_cancel(self._config_save_after_id)
+        self._config_save_after_id = self.after(500, self._flush_config)
+
+    def _flush_config(self):
+        """Write pending preference changes to the config file."""
+        self._config_save_after_id = None
         self.config_manager.save()
 
+    def _on_close(self):
+        """Save pending preferences and close the application."""
+        if self._config_save_after_id:
+            self.after_cancel(self._config_save_after_id)
+        self._flush_config()
+        self.destroy()
+
     def _toggle_extended_info(self, event=None):
         """Switch between Basic, Identify, Edit, and EXIF modes.
 
@@ -1549,35 +1608,27 @@ class MainWindow(TkinterDnD.Tk):
         is_edit = mode == 'Edit'
         is_meta = mode == 'Meta'
 
-        # Mode hints for status bar
-        mode_hints = {
-            'Basic': "Drop files to add photographer, site, and activity info",
-            'Identify': "Search or select a species, then drop files to identify",
-            'Edit': "Drop files to batch edit their metadata",
-            'Meta': "Drop Basic/Identify format files to auto-extract GPS from filename"
-        }
-
         # Hide EXIF frame by default
         if hasattr(self, 'exif_frame'):
             self.exif_frame.grid_remove()
 
         if is_basic:
-            self._toggle_checkboxes(False, False, False, False, False, False, False, True, True, True, True)
+            self._toggle_checkboxes(_FIELDS_BASIC)
             self._toggle_tree(False)
             self.bt_rename.grid_remove()
             self.bottom_frame.grid()
         elif is_identify:
-            self._toggle_checkboxes(True, True, True, True, True, True, True, False, False, False, False)
+            self._toggle_checkboxes(_FIELDS_IDENTIFY)
             self._toggle_tree(True)
             self.bt_rename.grid_remove()
             self.bottom_frame.grid()
         elif is_edit:
-            self._toggle_checkboxes(False, False, False, False, False, False, False, False, False, False, False)
+            self._toggle_checkboxes(_FIELDS_NONE)
             self._toggle_tree(True)
             self.bt_rename.grid()
             self.bottom_frame.grid()
         elif is_meta:
-            self._toggle_checkboxes(False, False, False, False, False, False, False, False, False, False, False)
+            self._toggle_checkboxes(_FIELDS_NONE)
             self._toggle_tree(False)
             self.bt_rename.grid_remove()
             self.bottom_frame.grid_remove()
@@ -1587,37 +1638,40 @@ class MainWindow(TkinterDnD.Tk):
 
         if not is_meta:
             self._reset_info()
-        self._notice(mode_hints[mode])
+        self._notice(MODE_HINTS[mode])
     
-    def _toggle_checkboxes(self, family, genus, species, confidence, phase, colour, behaviour, author, site, activity, camera):
+    def _setup_edit_field_table(self):
+        """Collect the 11 editable fields in UI order for the table-driven helpers.
+
+        Each entry is (combobox, label, display lookup, cascade handler). The
+        display lookup maps a parsed filename value to the combobox text; the
+        cascade handler refreshes dependent comboboxes after a value is set.
+        """
+        self._edit_fields = (
+            (self.cb_family, self.cb_family_label, None, self.set_family),
+            (self.cb_genus, self.cb_genus_label, None, self.set_genus),
+            (self.cb_species, self.cb_species_label, None, None),
+            (self.cb_confidence, self.cb_confidence_label, None, None),
+            (self.cb_phase, self.cb_phase_label, None, None),
+            (self.cb_colour, self.cb_colour_label, None, None),
+            (self.cb_behaviour, self.cb_behaviour_label, None, None),
+            (self.cb_author, self.cb_author_label, self.data.get_user_name, None),
+            (self.cb_site, self.cb_site_label, self.data.get_divesite_area_site, None),
+            (self.cb_activity, self.cb_activity_label, None, None),
+            (self.cb_camera, self.cb_camera_label, None, None),
+        )
+
+    def _toggle_checkboxes(self, visible):
         """Show or hide comboboxes and their labels based on boolean flags.
 
         Args:
-            family: Show/hide family combobox
-            genus: Show/hide genus combobox
-            species: Show/hide species combobox
-            confidence: Show/hide confidence combobox
-            phase: Show/hide phase combobox
-            colour: Show/hide colour combobox
-            behaviour: Show/hide behaviour combobox
-            author: Show/hide author combobox
-            site: Show/hide site combobox
-            activity: Show/hide activity combobox
-            camera: Show/hide camera combobox
+            visible: 11 flags in UI order (family, genus, species, confidence,
+                phase, colour, behaviour, author, site, activity, camera)
         """
-        self._toggle_widget(self.cb_family, self.cb_family_label, family)
-        self._toggle_widget(self.cb_genus, self.cb_genus_label, genus)
-        self._toggle_widget(self.cb_species, self.cb_species_label, species)
-        self._toggle_widget(self.cb_confidence, self.cb_confidence_label, confidence)
-        self._toggle_widget(self.cb_phase, self.cb_phase_label, phase)
-        self._toggle_widget(self.cb_colour, self.cb_colour_label, colour)
-        self._toggle_widget(self.cb_behaviour, self.cb_behaviour_label, behaviour)
-        self._toggle_widget(self.cb_author, self.cb_author_label, author)
-        self._toggle_widget(self.cb_site, self.cb_site_label, site)
-        self._toggle_widget(self.cb_activity, self.cb_activity_label, activity)
-        self._toggle_widget(self.cb_camera, self.cb_camera_label, camera)
+        for (widget, label, _, _), show in zip(self._edit_fields, visible):
+            self._toggle_widget(widget, label, show)
         # Show/hide Google Maps link with site field
-        if site:
+        if visible[8]:
             self.link.grid()
         else:
             self.link.grid_remove()
@@ -1650,41 +1704,24 @@ class MainWindow(TkinterDnD.Tk):
             self.upper_frame.grid_remove()
             self.middle_frame.grid_remove()
 
-    def _set_checkboxes(self, family, genus, species, confidence, phase, colour, behaviour, author, site, activity, camera):
+    def _set_checkboxes(self, values):
         """Set combobox values from parsed filename data.
 
         Used in Edit mode to populate comboboxes with values extracted from
-        filenames. Triggers cascading updates for taxonomy fields.
+        filenames. Triggers cascading updates for taxonomy fields; author and
+        site codes are converted to their display names.
 
         Args:
-            family: Family name to set (triggers genus/species update)
-            genus: Genus name to set (triggers species update)
-            species: Species name to set
-            confidence: Confidence level to set
-            phase: Phase to set
-            colour: Colour abbreviation/label to set
-            behaviour: Behaviour abbreviation/label to set
-            author: Author code to set (converted to full name)
-            site: Site code to set (converted to formatted string)
-            activity: Activity to set
-            camera: Camera full name to set
+            values: 11 values in UI order (family, genus, species, confidence,
+                phase, colour, behaviour, author, site, activity, camera);
+                empty values are left unchanged
         """
-        if family:
-            self.cb_family.set(family)
-            self.set_family(None)  # Trigger to update genus/species comboboxes based on family
-        if genus:
-            self.cb_genus.set(genus)
-            self.set_genus(None)  # Trigger to update species combobox based on genus
-        if species: self.cb_species.set(species)
-        if confidence: self.cb_confidence.set(confidence)
-        if phase: self.cb_phase.set(phase)
-        # reverse lookup
-        if colour: self.cb_colour.set(colour)
-        if behaviour: self.cb_behaviour.set(behaviour)
-        if author: self.cb_author.set(self.data.get_user_name(author))
-        if site: self.cb_site.set(self.data.get_divesite_area_site(site))
-        if activity: self.cb_activity.set(activity)
-        if camera: self.cb_camera.set(camera)
+        for (widget, _, lookup, cascade), value in zip(self._edit_fields, values):
+            if not value:
+                continue
+            widget.set(lookup(value) if lookup else value)
+            if cascade:
+                cascade(None)  # Update the dependent taxonomy comboboxes
 
     def _row_selected(self, event):
         """Handle treeview row selection.
@@ -1695,8 +1732,15 @@ class MainWindow(TkinterDnD.Tk):
         Args:
             event: Tkinter event
         """
-        if not self.tree.selection(): return
-        item = self.tree.selection()[0]
+        selection = self.tree.selection()
+        if not selection: return
+        item = selection[0]
+
+        # Re-clicking the selected row (or clicking a header/scrollbar) changes
+        # nothing while the comboboxes still show what the last selection set
+        if item == self._selected_item and self._current_taxonomy_values() == self._selected_values:
+            return
+
         fam, gen, spec, common_name = self.tree.item(item, 'values')
         # Reset only attribute comboboxes (don't call _reset_info which rebuilds tree)
         self.cb_confidence.set(self.data.confidence_default)
@@ -1709,18 +1753,27 @@ class MainWindow(TkinterDnD.Tk):
         self.cb_species.set(spec)
         self.selection_confident(True)
 
-        fam_df = self.data.filter_fish({'Family': fam})
-        fam_gen_df = self.data.filter_fish({'Family': fam, 'Genus': gen})
-        self.cb_genus['values'] = [self.data.genus_default] + self.data.unique_column(fam_df, 'Genus')
-        self.cb_species['values'] = [self.data.species_default] + self.data.unique_column(fam_gen_df, 'Species')
+        genera, _ = self.data.get_fish_choices(fam)
+        _, species = self.data.get_fish_choices(fam, gen)
+        self.cb_genus['values'] = genera
+        self.cb_species['values'] = species
 
         # Enable genus and species dropdowns when row selected
         self.cb_genus.config(state='readonly')
         self.cb_species.config(state='readonly')
 
+        self._selected_item = item
+        self._selected_values = self._current_taxonomy_values()
+
         # Show selected species in status bar
         self._notice(f"Selected: {gen} {spec} ({common_name})")
 
+    def _current_taxonomy_values(self):
+        """Return the taxonomy and attribute combobox values as a tuple."""
+        return (self.cb_family.get(), self.cb_genus.get(), self.cb_species.get(),
+                self.cb_confidence.get(), self.cb_phase.get(),
+                self.cb_colour.get(), self.cb_behaviour.get())
+
 
     def fill_tree(self, items):
         """Populate the treeview with fish data.
@@ -1728,16 +1781,57 @@ class MainWindow(TkinterDnD.Tk):
         Args:
             items: List of lists containing fish data rows [Family, Genus, Species, Common Name]
         """
+        # Cached result lists (e.g. get_all_fish) come back as the same object;
+        # skip rebuilding the rows when that list is already displayed
+        if items is self._tree_items:
+            return
+        self._cancel_tree_fill()
+        self._tree_items = items
+        self._selected_item = None  # Item ids are not reused across fills
         self.clear_tree()
-        for item in items:
-            self.tree.insert('', 'end', values=item)
+        self._insert_tree_rows(items, 0)
         # Update Species header with count
         self.tree.heading('Species', text=f'Species ({len(items)})')
 
+    def _insert_tree_rows(self, items, start):
+        """Insert one chunk of rows and schedule the next one.
+
+        Large lists are added over several event-loop passes so the first
+        rows appear immediately and typing or clicking is not blocked.
+
+        Args:
+            items: List of rows passed to fill_tree
+            start: Index of the first row to insert
+        """
+        end = start + TREE_FILL_CHUNK
+        insert = self.tree.insert
+        for item in items[start:end]:
+            insert('', 'end', values=item)
+        if end < len(items):
+            self._tree_fill_after_id = self.after(1, self._insert_tree_rows, items, end)
+        else:
+            self._tree_fill_after_id = None
+
+    def _cancel_tree_fill(self):
+        """Stop inserting the remaining rows of a previous fill_tree call."""
+        if self._tree_fill_after_id:
+            self.after_cancel(self._tree_fill_after_id)
+            self._tree_fill_after_id = None
+
+    def _finish_tree_fill(self):
+        """Insert any rows still pending from fill_tree right away."""
+        if self._tree_fill_after_id:
+            self._cancel_tree_fill()
+            items = self._tree_items
+            insert = self.tree.insert
+            for item in items[len(self.tree.get_children()):]:
+                insert('', 'end', values=item)
+
     def clear_tree(self):
         """Remove all items from the treeview."""
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
     def search(self, event):
         """Search for fish species based on user input.
@@ -1769,6 +1863,7 @@ class MainWindow(TkinterDnD.Tk):
         family = self.cb_family.get()
         if family == self.data.family_default:
             filtered_df = self.data.filter_fish()
+            genera, species = self.data.get_fish_choices()
             # Disable genus and species when family is default
             self.cb_genus.set(self.data.genus_default)
             self.cb_genus.config(state='disabled')
@@ -1776,13 +1871,14 @@ class MainWindow(TkinterDnD.Tk):
             self.cb_species.config(state='disabled')
         else:
             filtered_df = self.data.filter_fish({'Family': family})
+            genera, species = self.data.get_fish_choices(family)
             self.cb_genus.config(state='readonly')
             # Species stays disabled until genus is selected
             self.cb_species.set(self.data.species_default)
             self.cb_species.config(state='disabled')
-        self.cb_genus['values'] = [self.data.genus_default] + self.data.unique_column(filtered_df, 'Genus')
+        self.cb_genus['values'] = genera
         self.cb_genus.set(self.data.genus_default)
-        self.cb_species['values'] = [self.data.species_default] + self.data.unique_column(filtered_df, 'Species')
+        self.cb_species['values'] = species
         self.fill_tree(self.data.to_values(filtered_df))
 
         if family == self.data.family_default: self.selection_confident(False)
@@ -1802,15 +1898,17 @@ class MainWindow(TkinterDnD.Tk):
         # Reset and disable species when genus is default
         if genus == self.data.genus_default:
             filtered_df = self.data.filter_fish({'Family': family})
-            self.cb_genus['values'] = [self.data.genus_default] + self.data.unique_column(filtered_df, 'Genus')
+            genera, species = self.data.get_fish_choices(family)
+            self.cb_genus['values'] = genera
             self.cb_genus.set(self.data.genus_default)
             self.cb_species.set(self.data.species_default)
             self.cb_species.config(state='disabled')
         else:
             filtered_df = self.data.filter_fish({'Family': family, 'Genus': genus})
+            _, species = self.data.get_fish_choices(family, genus)
             self.cb_species.config(state='readonly')
 
-        self.cb_species['values'] = [self.data.species_default] + self.data.unique_column(filtered_df, 'Species')
+        self.cb_species['values'] = species
         if genus != self.data.genus_default:
             self.cb_species.set(self.data.species_default)
         self.fill_tree(self.data.to_values(filtered_df))
@@ -1855,8 +1953,10 @@ class MainWindow(TkinterDnD.Tk):
             col: The column name to sort by
             descending: If True, sort in descending order; if False, ascending
         """
+        self._finish_tree_fill()  # Sort the complete list, not a partial fill
         data = [(tree.set(child, col), child) for child in tree.get_children('')]
         data.sort(reverse=descending)
+        self._tree_items = None  # Display order no longer matches the filled list
         for ix, item in enumerate(data):
             tree.move(item[1], '', ix)
         tree.heading(col, command=lambda c=col: self.sortby(tree, c, not descending))
@@ -1902,22 +2002,11 @@ class MainWindow(TkinterDnD.Tk):
                 self._notice("No valid files to rename")
                 return
 
-        # Clear history for new rename batch
-        self.rename_history.clear()
-
-        renamed_count = 0
-        total = len(to_rename)
-        self._show_progress(total, f"Renaming 0/{total}...")
-
-        for i, mapping in enumerate(to_rename):
-            if self._edit_single_file(mapping['path']):
-                renamed_count += 1
-            self._update_progress(i + 1, f"Renaming {i + 1}/{total}...")
+        def on_done(renamed, total):
+            self._notice(f"{renamed}/{total} files were renamed successfully.")
+            self._cleanup_after_edit()
 
-        self._hide_progress()
-        # Update UI
-        self._notice(f"{renamed_count}/{len(to_rename)} files were renamed successfully.")
-        self._cleanup_after_edit()
+        self._run_rename_batch(to_rename, on_done)
 
     def _generate_previews_edit(self, files):
         """Generate preview data for edit mode renames.
@@ -1930,11 +2019,13 @@ class MainWindow(TkinterDnD.Tk):
         Returns:
             List of dicts with keys: path, original, new, error
         """
+        # UI values are the same for every file in the batch
+        edited = self._resolve_edited_values()
+
         previews = []
         for file_path in files:
             original = os.path.basename(file_path)
-            filepath, extension = os.path.splitext(file_path)
-            basename = os.path.basename(filepath)
+            basename, extension = os.path.splitext(original)
 
             preview = {'path': file_path, 'original': original, 'new': None, 'error': None}
 
@@ -1944,17 +2035,15 @@ class MainWindow(TkinterDnD.Tk):
                 gps_suffix = basename[-2:]
 
             if self.editing_format == 'identity':
-                # Parse Identity format filename
-                match = self.assembler.regex_match_identity(basename)
-                if not match:
+                # Fields were parsed and validated when the files were dropped
+                info = self.editing_info.get(file_path) or self.assembler.split_identity_fields(basename)
+                if not info:
                     preview['error'] = 'Invalid format'
                     previews.append(preview)
                     continue
 
-                info = match.groups()
-
                 # Build new filename from edited/original fields
-                edited_fields = self._collect_edited_fields(info)
+                edited_fields = self._collect_edited_fields(info, edited)
                 edited_fields['filename'] += gps_suffix
 
                 new_filename = self.assembler.assemble_edited_filename(
@@ -1976,22 +2065,18 @@ class MainWindow(TkinterDnD.Tk):
                 )
 
             elif self.editing_format == 'basic':
-                # Parse Basic format filename: AuthorCode_SiteString_Date_Time_Activity_Camera_OriginalName
-                # Remove _G or _N suffix if present (already captured in gps_suffix above)
-                clean_basename = basename[:-2] if gps_suffix else basename
-                parts = clean_basename.split('_')
-                if len(parts) < 7:
-                    preview['error'] = 'Invalid format'
-                    previews.append(preview)
-                    continue
-
-                # Create info tuple matching Identity format structure (14 elements)
-                # [0-6: taxonomy (None), 7: author, 8: site, 9: date, 10: time, 11: activity, 12: camera, 13: original]
-                info = (None, None, None, None, None, None, None,
-                       parts[0], parts[1], parts[2], parts[3], parts[4], parts[5], '_'.join(parts[6:]))
+                # Fields were parsed when the files were dropped
+                info = self.editing_info.get(file_path)
+                if info is None:
+                    try:
+                        info = self.assembler.parse_basic_files([basename])[0]
+                    except ValueError:
+                        preview['error'] = 'Invalid format'
+                        previews.append(preview)
+                        continue
 
                 # Build new filename from edited/original fields
-                edited_fields = self._collect_edited_fields(info)
+                edited_fields = self._collect_edited_fields(info, edited)
                 edited_fields['filename'] += gps_suffix
 
                 new_filename = self.assembler.assemble_edited_basic_filename(
@@ -2017,211 +2102,64 @@ class MainWindow(TkinterDnD.Tk):
             previews.append(preview)
         return previews
 
-    def _edit_single_file(self, file_path):
-        """Edit a single file based on current UI selections.
+    def _resolve_edited_values(self):
+        """Read the edited fields from the UI once for a whole batch.
 
-        Handles both Basic and Identity format files.
+        Widget reads and label/author/site/camera lookups are the same for
+        every file, so they are done here rather than per file.
 
         Returns:
-            bool: True if file was renamed successfully, False otherwise
+            dict: Parsed-tuple index to new value, for edited fields only
         """
-        try:
-            filepath, extension = os.path.splitext(file_path)
-            basename = os.path.basename(filepath)
-
-            # Capture GPS suffix before parsing strips it
-            gps_suffix = ''
-            if basename.endswith('_G') or basename.endswith('_N'):
-                gps_suffix = basename[-2:]
-
-            if self.editing_format == 'identity':
-                # Parse Identity format filename
-                match = self.assembler.regex_match_identity(basename)
-                if not match:
-                    return False
-
-                info = match.groups()
-
-                # Build new filename from edited/original fields
-                edited_fields = self._collect_edited_fields(info)
-                edited_fields['filename'] += gps_suffix
-
-                new_filename = self.assembler.assemble_edited_filename(
-                    edited_fields['family'],
-                    edited_fields['genus'],
-                    edited_fields['species'],
-                    edited_fields['confidence'],
-                    edited_fields['phase'],
-                    edited_fields['colour'],
-                    edited_fields['behaviour'],
-                    edited_fields['author_code'],
-                    edited_fields['site_string'],
-                    edited_fields['date'],
-                    edited_fields['time'],
-                    edited_fields['activity'],
-                    edited_fields['camera'],
-                    edited_fields['filename'],
-                    extension
-                )
-
-            elif self.editing_format == 'basic':
-                # Parse Basic format filename: AuthorCode_SiteString_Date_Time_Activity_Camera_OriginalName
-                # Remove _G or _N suffix if present (already captured in gps_suffix above)
-                clean_basename = basename[:-2] if gps_suffix else basename
-                parts = clean_basename.split('_')
-                if len(parts) < 7:
-                    return False
-
-                # Create info tuple matching Identity format structure (14 elements)
-                # [0-6: taxonomy (None), 7: author, 8: site, 9: date, 10: time, 11: activity, 12: camera, 13: original]
-                info = (None, None, None, None, None, None, None,
-                       parts[0], parts[1], parts[2], parts[3], parts[4], parts[5], '_'.join(parts[6:]))
-
-                # Build new filename from edited/original fields
-                edited_fields = self._collect_edited_fields(info)
-                edited_fields['filename'] += gps_suffix
-
-                new_filename = self.assembler.assemble_edited_basic_filename(
-                    edited_fields['author_code'],
-                    edited_fields['site_string'],
-                    edited_fields['date'],
-                    edited_fields['time'],
-                    edited_fields['activity'],
-                    edited_fields['camera'],
-                    edited_fields['filename'],
-                    extension
-                )
-            else:
-                return False
-
-            from pathlib import Path
-            from src.app_utils import validate_safe_path
-            import shutil
-
-            dir_name = os.path.dirname(file_path)
-            new_filepath = os.path.join(dir_name, new_filename)
-
-            # Validate that new path is in the same directory (prevent path traversal)
-            if not validate_safe_path(Path(dir_name), Path(new_filename)):
-                logger.warning(f"Rejecting unsafe rename path: {new_filename}")
-                return False
-
-            # Check if target exists
-            if os.path.exists(new_filepath):
-                return False
-
-            # Create backup before renaming
-            backup_path = f"{file_path}.backup"
-            try:
-                # Copy file to backup
-                shutil.copy2(file_path, backup_path)
-
-                # Attempt rename
-                os.rename(file_path, new_filepath)
-
-                # Remove backup on success
-                os.remove(backup_path)
-
-                # Record for undo
-                self.rename_history.append((file_path, new_filepath))
-
-                logger.debug(f"Successfully edited: {os.path.basename(file_path)} -> {os.path.basename(new_filepath)}")
-                return True
-            except Exception as e:
-                # Restore from backup if rename failed
-                if os.path.exists(backup_path):
-                    if not os.path.exists(file_path):
-                        shutil.move(backup_path, file_path)
-                        logger.info(f"Restored from backup: {os.path.basename(file_path)}")
-                    else:
-                        os.remove(backup_path)
-                logger.error(f"Edit failed, restored backup: {e}")
-                raise
-
-        except (OSError, IOError, AttributeError, IndexError) as e:
-            self._warn(f"Error editing {os.path.basename(file_path)}: {e}")
-            return False
-
-    def _collect_edited_fields(self, info):
-        """Collect edited fields from UI or keep original values.
-
-        Args:
-            info: Tuple of parsed filename components
-
-        Returns:
-            dict: Dictionary of field names to values
-        """
-        # Field indices in parsed info tuple (14 elements):
-        # 0: family, 1: genus, 2: species, 3: confidence, 4: phase,
-        # 5: colour, 6: behaviour, 7: author, 8: site, 9: date,
-        # 10: time, 11: activity, 12: camera, 13: original name
-
-        fields = {}
+        edited = {}
 
         # Taxonomy fields
-        fields['family'] = self.cb_family.get() if self.fields_to_edit[0] else info[0]
-        fields['genus'] = self.cb_genus.get() if self.fields_to_edit[1] else info[1]
-        fields['species'] = self.cb_species.get() if self.fields_to_edit[2] else info[2]
-
-        # Attribute fields
-        fields['confidence'] = self.data.get_abbreviation_reverse('Confidence', self.cb_confidence.get()) if self.fields_to_edit[3] else info[3]
-        fields['phase'] = self.data.get_abbreviation_reverse('Phase', self.cb_phase.get()) if self.fields_to_edit[4] else info[4]
-        fields['colour'] = self.data.get_abbreviation_reverse('Colour', self.cb_colour.get()) if self.fields_to_edit[5] else info[5]
-        fields['behaviour'] = self.data.get_abbreviation_reverse('Behaviour', self.cb_behaviour.get()) if self.fields_to_edit[6] else info[6]
-
-
-        # # Colour and behaviour (may need reverse lookup for abbreviations)
-        # if self.fields_to_edit[5]:
-        #     colour_value = self.cb_colour.get()
-        #     # Check if it's already an abbreviation or if we need to convert it
-        #     colour_abbrev = self.data.get_abbreviation_reverse('Colour', colour_value)
-        #     fields['colour'] = colour_abbrev if colour_abbrev else colour_value
-        # else:
-        #     fields['colour'] = info[5]
-
-        # if self.fields_to_edit[6]:
-        #     behaviour_value = self.cb_behaviour.get()
-        #     # Check if it's already an abbreviation or if we need to convert it
-        #     behaviour_abbrev = self.data.get_abbreviation_reverse('Behaviour', behaviour_value)
-        #     fields['behaviour'] = behaviour_abbrev if behaviour_abbrev else behaviour_value
-        # else:
-        #     fields['behaviour'] = info[6]
+        for index, combobox in ((0, self.cb_family), (1, self.cb_genus), (2, self.cb_species)):
+            if self.fields_to_edit[index]:
+                edited[index] = combobox.get()
+
+        # Attribute fields (stored as abbreviations)
+        for index, category, combobox in ((3, 'Confidence', self.cb_confidence), (4, 'Phase', self.cb_phase),
+                                          (5, 'Colour', self.cb_colour), (6, 'Behaviour', self.cb_behaviour)):
+            if self.fields_to_edit[index]:
+                edited[index] = self.data.get_abbreviation_reverse(category, combobox.get())
 
         # Author field
         if self.fields_to_edit[7]:
-            author = self.cb_author.get()
-            fields['author_code'] = self.data.get_user_code(author)
-        else:
-            fields['author_code'] = info[7]
+            edited[7] = self.data.get_user_code(self.cb_author.get())
 
-        # Site field
+        # Site field (kept as is unless a valid 'Area, Site' is selected)
         if self.fields_to_edit[8]:
             site = self.cb_site.get()
             if ', ' in site:
-                fields['site_string'] = self.data.get_divesite_string(*site.split(", ", 1))
-            else:
-                fields['site_string'] = info[8]
-        else:
-            fields['site_string'] = info[8]
+                edited[8] = self.data.get_divesite_string(*site.split(", ", 1))
 
-        # Datetime fields (never edited)
-        fields['date'] = info[9]
-        fields['time'] = info[10]
+        # Date, time (9-10) and original name (13) are never edited
 
         # Activity field
-        fields['activity'] = self.cb_activity.get() if self.fields_to_edit[11] else info[11]
+        if self.fields_to_edit[11]:
+            edited[11] = self.cb_activity.get()
 
         # Camera field
         if self.fields_to_edit[12]:
-            camera = self.cb_camera.get()
-            fields['camera'] = self.data.get_camera_abbreviation(camera)
-        else:
-            fields['camera'] = info[12]
+            edited[12] = self.data.get_camera_abbreviation(self.cb_camera.get())
 
-        # Original filename (never edited)
-        fields['filename'] = info[13]
+        return edited
 
-        return fields
+    def _collect_edited_fields(self, info, edited=None):
+        """Collect edited fields from UI or keep original values.
+
+        Args:
+            info: Tuple of parsed filename components
+            edited: Result of _resolve_edited_values() for the batch; read
+                from the UI when not given
+
+        Returns:
+            dict: Dictionary of field names to values
+        """
+        if edited is None:
+            edited = self._resolve_edited_values()
+        return {name: edited.get(i, info[i]) for i, name in enumerate(IDENTITY_FIELD_NAMES)}
 
     def _cleanup_after_edit(self):
         """Reset UI state after editing operation.
@@ -2231,4 +2169,5 @@ class MainWindow(TkinterDnD.Tk):
         """
         self._reset_info()
         self.editing_files = []
-        self._toggle_checkboxes(False, False, False, False, False, False, False, False, False, False, False)
\ No newline at end of file
+        self.editing_info = {}
+        self._toggle_checkboxes(_FIELDS_NONE)
\ No newline at end of file
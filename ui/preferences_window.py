@@ -4,10 +4,10 @@ from tkinter import ttk, messagebox
 import threading
 import time
 import os
-import re
 import subprocess
 import sys
 from src.app_utils import clear_data_files, initialize_data_files, get_data_path
+from src.constants import PATTERN_FILE_DATE
 
 
 class PreferencesWindow(tk.Toplevel):
@@ -148,7 +148,7 @@ class PreferencesWindow(tk.Toplevel):
         """
         path = self.config_manager.get_path(file_key)
         if path and path.exists():
-            match = re.search(r'(\d{4}-\d{2}-\d{2})', path.name)
+            match = PATTERN_FILE_DATE.search(path.name)
             if match:
                 return match.group(1)
         return '-'
@@ -249,7 +249,7 @@ class PreferencesWindow(tk.Toplevel):
 
         # Update the config manager with new paths
         for prefix, path in newest_files.items():
-            self.config_manager.set_path(prefix.lower(), path)
+            self.config_manager.set_path(prefix.lower(), path, save=False)
         self.config_manager.save()
 
         # Update UI on main thread
@@ -112,6 +112,8 @@ class BatchPreviewDialog(tk.Toplevel):
         self.tree.tag_configure('error', foreground='#d32f2f')
         self.tree.tag_configure('ok', foreground='#2e7d32')
 
+        # Keep the displayed values so auto-fit needn't read them back from Tk
+        self._row_values = []
         for mapping in self.file_mappings:
             original = mapping.get('original', '')
             new = mapping.get('new', '')
@@ -128,7 +130,9 @@ class BatchPreviewDialog(tk.Toplevel):
                 # Show new filename for successful renames
                 filename_display = new if new else original
 
-            self.tree.insert('', 'end', values=(filename_display, status), tags=(tag,))
+            row = (filename_display, status)
+            self._row_values.append(row)
+            self.tree.insert('', 'end', values=row, tags=(tag,))
 
     def _auto_fit_columns(self):
         """Auto-fit column widths based on content."""
@@ -142,21 +146,12 @@ class BatchPreviewDialog(tk.Toplevel):
             'status': 'Status'
         }
 
-        # Calculate max width for each column
+        # Measure each distinct cell text once per column
         col_widths = {}
-        for col in ('filename', 'status'):
-            # Start with header width
-            max_width = tree_font.measure(headers[col]) + padding
-
-            # Check all rows
-            for item in self.tree.get_children():
-                values = self.tree.item(item, 'values')
-                col_idx = {'filename': 0, 'status': 1}[col]
-                text = str(values[col_idx]) if col_idx < len(values) else ''
-                text_width = tree_font.measure(text) + padding
-                max_width = max(max_width, text_width)
-
-            col_widths[col] = max_width
+        for col_idx, col in enumerate(('filename', 'status')):
+            texts = {str(row[col_idx]) for row in self._row_values}
+            texts.add(headers[col])
+            col_widths[col] = max(tree_font.measure(text) for text in texts) + padding
 
         # Apply calculated widths
         for col, width in col_widths.items():